@@ -1,12 +1,47 @@
 # Import Pandas library (like a digital spreadsheet)
+import argparse
+import io
+import os
+import sys
+
 import pandas as pd
-from faker import Faker
+
+# Shared helpers of the Data_Analysis projects live one level up
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from analysis_trace import StageTracer  # noqa: E402
+from data_profile import profile_frame  # noqa: E402
+from student_synthetic import DEFAULT_AS_OF  # noqa: E402
+
+# Steps in run order, selectable with --stages
+STAGES = {
+    'quality': 'one-pass profile: nulls, duplicates, types, min/max, distinct values',
+    'cleaning': 'standardized Activity capitalization',
+    'activity_summary': 'students and average hours per activity, activities by grade',
+    'guardian_data': 'generate student_guardian_data.csv from seeded Faker name pools',
+}
+
+parser = argparse.ArgumentParser(description='Student activities cleaning and guardian data generation')
+parser.add_argument('--stages', default=','.join(STAGES),
+                    help='comma-separated steps to run: ' + '; '.join(f'{name} ({what})' for name, what in STAGES.items()))
+parser.add_argument('--no-plots', action='store_true',
+                    help='accepted like in the other scripts; this one draws no charts and never imports matplotlib')
+parser.add_argument('--seed', type=int, default=0, help='seed of the generated guardian data')
+parser.add_argument('--as-of', default=DEFAULT_AS_OF,
+                    help=f"date the generated guardians' ages are counted at (YYYY-MM-DD, default {DEFAULT_AS_OF})")
+args = parser.parse_args()
+stages = [stage for stage in args.stages.split(',') if stage]
+unknown = [stage for stage in stages if stage not in STAGES]
+if unknown:
+    parser.error(f"unknown stage(s) {', '.join(unknown)}; choose from {', '.join(STAGES)}")
+
+tracer = StageTracer.from_env('data_analysis.py')
 
 
 
 # Load the CSV file
+tracer.begin('LOAD DATA')
 # Option 1: If you uploaded the CSV to Colab
-data = pd.read_csv('student_activities.csv')
+# data = pd.read_csv('student_activities.csv')
 
 # Option 2: Create the CSV programmatically (if you don't want to upload)
 csv_data = """StudentID,Grade,Activity,HoursPerWeek,Satisfaction,SleepingHours,StressLevel
@@ -60,51 +95,56 @@ csv_data = """StudentID,Grade,Activity,HoursPerWeek,Satisfaction,SleepingHours,S
 48,11,Music,5,3,7,4
 49,10,Gaming,9,4,5,3
 50,9,Sports,5,5,"""
-with open('student_activities.csv', 'w') as file:
-    file.write(csv_data)
-data = pd.read_csv('student_activities.csv')
+# Parsed straight from memory; the file is only written for new_questions.py when it is missing
+data = pd.read_csv(io.StringIO(csv_data))
+if not os.path.exists('student_activities.csv'):
+    with open('student_activities.csv', 'w') as file:
+        file.write(csv_data)
+tracer.observe(data)
 
 # Display the first 5 rows to check the data
 print("First 5 rows of the data:")
 print(data.head())
 
-# Check for missing values
-print("Checking for missing values:")
-print(data.isnull().sum())
-
-# Check for duplicates
-print("\nChecking for duplicate rows:")
-print(data.duplicated().sum())
-
-# Ensure data types are correct
-print("\nData types:")
-print(data.dtypes)
-
-# For this dataset, no cleaning is needed (no missing values or duplicates),
-# but let's standardize the 'Activity' column to have consistent capitalization
-data['Activity'] = data['Activity'].str.capitalize()
-
-# Verify the changes
-print("\nFirst 5 rows after cleaning:")
-print(data.head())
-
-# Count students per activity
-activity_counts = data['Activity'].value_counts()
-print("\nNumber of students per activity:")
-print(activity_counts)
-
-# Calculate average hours per week by activity
-avg_hours = data.groupby('Activity')['HoursPerWeek'].mean().round(2)
-print("\nAverage hours per week by activity:")
-print(avg_hours)
-
-# Count students per activity by grade
-activity_by_grade = data.groupby(['Grade', 'Activity']).size().unstack(fill_value=0)
-print("\nActivity counts by grade:")
-print(activity_by_grade)
-
-# Import Matplotlib for plotting
-import matplotlib.pyplot as plt
+if 'quality' in stages:
+    # Missing values, duplicates and data types, from one pass over the data
+    tracer.begin('DATA QUALITY CHECKS', data)
+    profile = profile_frame(data)
+    print("Data quality profile:")
+    print(profile.table().to_string())
+
+    print("\nDuplicate rows:")
+    print(profile.duplicates)
+
+if 'cleaning' in stages:
+    tracer.begin('CLEANING', data)
+    # For this dataset, no cleaning is needed (no missing values or duplicates),
+    # but let's standardize the 'Activity' column to have consistent capitalization
+    data['Activity'] = data['Activity'].str.capitalize()
+
+    # Verify the changes
+    print("\nFirst 5 rows after cleaning:")
+    print(data.head())
+
+if 'activity_summary' in stages:
+    # Count students per activity
+    tracer.begin('ACTIVITY SUMMARY', data)
+    activity_counts = data['Activity'].value_counts()
+    print("\nNumber of students per activity:")
+    print(activity_counts)
+
+    # Calculate average hours per week by activity
+    avg_hours = data.groupby('Activity')['HoursPerWeek'].mean().round(2)
+    print("\nAverage hours per week by activity:")
+    print(avg_hours)
+
+    # Count students per activity by grade
+    activity_by_grade = data.groupby(['Grade', 'Activity']).size().unstack(fill_value=0)
+    print("\nActivity counts by grade:")
+    print(activity_by_grade)
+
+# The charts below are commented out, so Matplotlib is not imported at all;
+# bring back `import matplotlib.pyplot as plt` along with any of them
 
 # Bar chart for activity popularity
 """plt.figure(figsize=(8, 5))
@@ -165,36 +205,18 @@ plt.ylabel('Stress Level')
 plt.grid(True)
 plt.show()"""
 
-# Generate fake data using Fakerimport pandas as pd
-import pandas as pd
-from faker import Faker
-import random
-
-fake = Faker()
-
-def generate_indian_number():
-    # Mobile numbers in India usually start with 6,7,8,9
-    first_digit = str(random.choice([6,7,8,9]))
-    number = first_digit + ''.join([str(random.randint(0,9)) for _ in range(9)])
-    return "+91" + number
-
-data = []
-for i in range(1,51):
-    age = random.randint(12, 18)
-    dob = fake.date_of_birth(minimum_age=age, maximum_age=age)
-    
-    data.append({
-        "StudentID": i,
-        "Age": age,
-        "DOB": dob,
-        "Email": fake.email(),
-        "GuardianName": fake.name(),
-        "GuardianContact": generate_indian_number()
-    })
-
-df = pd.DataFrame(data)
-print(df.head())
-
-# Save to CSV
-df.to_csv("student_guardian_data.csv", index=False)
+# Generate fake data using Faker
+if 'guardian_data' in stages:
+    tracer.begin('GENERATE GUARDIAN DATA')
+    # Faker only fills the name pools; ages, birth dates, e-mails and
+    # +91 mobile numbers are drawn for all students at once
+    from student_synthetic import GuardianGenerator
+
+    df = GuardianGenerator(args.seed, as_of=args.as_of).frame(50)
+    tracer.observe(df)
+    print(df.head())
+
+    # Save to CSV
+    df.to_csv("student_guardian_data.csv", index=False)
 
+tracer.finish()
@@ -1,190 +1,280 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-
-# Load both datasets
-activities_data = pd.read_csv('student_activities.csv')
-guardian_data = pd.read_csv('student_guardian_data.csv')
-
-# Merge datasets using StudentID as the common key
-data = pd.merge(activities_data, guardian_data, on='StudentID', how='inner')
-
-# Save merged dataset to a new CSV file
-data.to_csv('merged_student_data.csv', index=False)
-print("✅ Merged dataset saved as 'merged_student_data.csv'")
-
-# Display information about the merged dataset
-print("Merged dataset shape:", data.shape)
-print("\nColumns in merged dataset:", list(data.columns))
-print("\nFirst few rows of merged data:")
-print(data.head())
-print("\nMissing values in merged data:")
-print(data.isnull().sum())
-
-
-
-activities = ['Sports', 'Music', 'Gaming', 'Art']
-filtered = data[data['Activity'].isin(activities)]
-counts = filtered.groupby(['Grade', 'Activity']).size().unstack(fill_value=0)
-print("\n",counts)
-
-# Plot
-counts.plot(kind='bar', figsize=(10, 6))
-plt.title('Student Participation by Grade and Activity')
-plt.xlabel('Grade')
-plt.ylabel('Number of Students')
-plt.legend(title='Activity')
-plt.tight_layout()
-plt.show()
-
-
-# Group by activity and calculate average hours and satisfaction
-summary = data.groupby('Activity')[['HoursPerWeek', 'Satisfaction']].mean().round(2)
-
-# Plot
-plt.figure(figsize=(8, 6))
-plt.scatter(summary['HoursPerWeek'], summary['Satisfaction'], color='teal', s=100)
+import argparse
+import os
+import sys
 
-# Add labels
-for activity, row in summary.iterrows():
-    plt.text(row['HoursPerWeek'] + 0.1, row['Satisfaction'], activity, fontsize=9)
-
-plt.title('Average Hours vs. Satisfaction by Activity')
-plt.xlabel('Average Hours')
-plt.ylabel('Average Satisfaction')
-plt.grid(True)
-plt.tight_layout()
-plt.show()
-
-# Additional analysis with merged data
-print("\n" + "="*50)
-print("ADDITIONAL ANALYSIS WITH MERGED DATA")
-print("="*50)
+import pandas as pd
 
-# Analysis 1: Average satisfaction by age group
+# Shared helpers of the Data_Analysis projects live one level up
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from analysis_report import Report  # noqa: E402
+from analysis_trace import StageTracer  # noqa: E402
+from data_profile import profile_frame  # noqa: E402
+from result_cache import ResultCache, dataset_fingerprint  # noqa: E402
+from student_bitmap import BitmapIndex  # noqa: E402
+from student_join import inferred_dtypes, join_students  # noqa: E402
+from student_report import SPLITS, render_report, write_reports  # noqa: E402
+
+# Report sections in output order, selectable with --stages
+STAGES = {
+    'merged': 'shape, columns and missing values of the merged data',
+    'participation': 'participation by grade and activity, hours vs satisfaction',
+    'additional': 'age groups, most active students, correlations, sleep vs stress',
+    'stress': 'stress level counts and high stress student details',
+    'high_stress_report': 'guardian contact report for high stress students',
+    'comparison': 'high versus low stress averages',
+}
+PLOTTING_STAGES = {'participation', 'additional', 'comparison'}
+
+parser = argparse.ArgumentParser(description='Student activity, stress and guardian analysis')
+parser.add_argument('--stages', default=','.join(STAGES),
+                    help='comma-separated sections to run: ' + '; '.join(f'{name} ({what})' for name, what in STAGES.items()))
+parser.add_argument('--no-plots', action='store_true', help='skip every chart; matplotlib is never imported')
+parser.add_argument('--contacts-by', choices=list(SPLITS),
+                    help='also write the guardian contact report as one file per grade or per guardian')
+parser.add_argument('--contacts-dir', default='high_stress_reports', help='directory for the --contacts-by files')
+args = parser.parse_args()
+stages = [stage for stage in args.stages.split(',') if stage]
+unknown = [stage for stage in stages if stage not in STAGES]
+if unknown:
+    parser.error(f"unknown stage(s) {', '.join(unknown)}; choose from {', '.join(STAGES)}")
+plots = not args.no_plots and bool(PLOTTING_STAGES.intersection(stages))
+
+if plots:
+    # Plotting modules are the slowest imports, so text-only runs skip them
+    import matplotlib.pyplot as plt
+    from density_plot import density_scatter
+
+tracer = StageTracer.from_env('new_questions.py')
+# Groupby results are reused across runs while both input files are unchanged
+cache = ResultCache.from_env('new_questions.py')
+fingerprint = dataset_fingerprint('student_activities.csv', 'student_guardian_data.csv')
+# Results are collected as structured sections and written in one pass at the end
+report = Report.from_env('Student Activities and Guardian Data')
+
+# Load both datasets and merge them on StudentID, chunk by chunk with
+# explicit dtypes (GuardianContact keeps its "+"), saving the merged
+# dataset to a new CSV file on the way
+tracer.begin('LOAD AND MERGE')
+data = inferred_dtypes(pd.concat(join_students('student_activities.csv', 'student_guardian_data.csv',
+                                               output_path='merged_student_data.csv'), ignore_index=True))
+
+tracer.observe(data)
+
+if 'merged' in stages:
+    report.section('MERGED DATASET', banner='')
+    report.text("✅ Merged dataset saved as 'merged_student_data.csv'")
+
+    # Display information about the merged dataset
+    report.value('shape', data.shape, f"Merged dataset shape: {data.shape}")
+    report.value('columns', list(data.columns), f"\nColumns in merged dataset: {list(data.columns)}")
+    report.text("\nFirst few rows of merged data:")
+    report.table('head', data.head())
+    # Nulls, duplicates, types, min/max and distinct counts come from one pass;
+    # the console keeps showing the missing values only
+    profile = profile_frame(data)
+    quality = profile.table()
+    report.text("\nMissing values in merged data:")
+    report.table('missing_values', quality['nulls'].rename(None).rename_axis(None))
+    report.table('profile', quality, '')
+    report.value('duplicate_rows', profile.duplicates, '')
+
+# Cohorts below are filtered and counted through bitmaps of the
+# low-cardinality columns instead of scanning the whole frame each time
+tracer.begin('COHORT INDEX', data)
 data['AgeGroup'] = pd.cut(data['Age'], bins=[10, 13, 15, 18], labels=['12-13', '14-15', '16-18'])
-age_satisfaction = data.groupby('AgeGroup')['Satisfaction'].mean().round(2)
-print("\nAverage Satisfaction by Age Group:")
-print(age_satisfaction)
-
-# Analysis 2: Activity participation by grade with guardian info
-print("\nTop 5 most active students with guardian info:")
-top_active = data.nlargest(5, 'HoursPerWeek')[['StudentID', 'Grade', 'Activity', 'HoursPerWeek', 'GuardianName']]
-print(top_active)
-
-# Analysis 3: Correlation between stress level and hours per week
-correlation = data['StressLevel'].corr(data['HoursPerWeek'])
-print(f"\nCorrelation between Stress Level and Hours Per Week: {correlation:.2f}")
-
-# Analysis 4: Average hours by activity and grade
-activity_grade_hours = data.groupby(['Activity', 'Grade'])['HoursPerWeek'].mean().round(2)
-print("\nAverage Hours by Activity and Grade:")
-print(activity_grade_hours)
-
-# Analysis 5: Scatter plot of Stress Level vs Sleep Hours
-plt.figure(figsize=(10, 6))
-scatter = plt.scatter(data['SleepingHours'], data['StressLevel'],
-                     c=data['Satisfaction'], cmap='viridis', s=50, alpha=0.7)
-
-# Add colorbar
-cbar = plt.colorbar(scatter)
-cbar.set_label('Satisfaction Level')
-
-# Add labels and title
-plt.title('Relationship between Sleep Hours and Stress Level')
-plt.xlabel('Sleeping Hours per Night')
-plt.ylabel('Stress Level')
-plt.grid(True, alpha=0.3)
-
-# Add correlation coefficient
-correlation_sleep_stress = data['SleepingHours'].corr(data['StressLevel'])
-plt.text(0.05, 0.95, f'Correlation: {correlation_sleep_stress:.2f}',
-         transform=plt.gca().transAxes, fontsize=12,
-         verticalalignment='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
-
-plt.tight_layout()
-plt.show()
-
-# Print summary statistics for this relationship
-print(f"\nCorrelation between Sleep Hours and Stress Level: {correlation_sleep_stress:.2f}")
-sleep_stress_summary = data.groupby('StressLevel')['SleepingHours'].agg(['mean', 'std', 'count']).round(2)
-print("\nSleep Hours Statistics by Stress Level:")
-print(sleep_stress_summary)
-
-# Analysis 6: Students with High Stress Levels
-print("\n" + "="*50)
-print("STRESS LEVEL ANALYSIS")
-print("="*50)
-
-# Count students by stress level
-stress_counts = data['StressLevel'].value_counts().sort_index()
-print("\nNumber of Students by Stress Level:")
-print(stress_counts)
-
-# Define high stress levels (assuming 4-5 are high stress on a 1-5 scale)
+cohorts = BitmapIndex(data)
+
+if 'participation' in stages:
+    tracer.begin('PARTICIPATION BY GRADE AND ACTIVITY', data)
+    activities = ['Sports', 'Music', 'Gaming', 'Art']
+    filtered = cohorts.select(cohorts.isin('Activity', activities))
+    counts = cache.memoize(fingerprint, ['Grade', 'Activity'], {'StudentID': 'size'},
+                           lambda: filtered.groupby(['Grade', 'Activity']).size().unstack(fill_value=0),
+                           filters={'Activity': activities})
+    report.section('PARTICIPATION BY GRADE AND ACTIVITY', banner='')
+    report.table('participation', counts, f"\n {counts}")
+
+    # Group by activity and calculate average hours and satisfaction
+    summary = cache.memoize(fingerprint, ['Activity'], {'HoursPerWeek': 'mean', 'Satisfaction': 'mean'},
+                            lambda: data.groupby('Activity')[['HoursPerWeek', 'Satisfaction']].mean().round(2))
+
+if 'participation' in stages and plots:
+    # Plot
+    counts.plot(kind='bar', figsize=(10, 6))
+    plt.title('Student Participation by Grade and Activity')
+    plt.xlabel('Grade')
+    plt.ylabel('Number of Students')
+    plt.legend(title='Activity')
+    plt.tight_layout()
+    plt.show()
+
+    # Plot
+    plt.figure(figsize=(8, 6))
+    plt.scatter(summary['HoursPerWeek'], summary['Satisfaction'], color='teal', s=100)
+
+    # Add labels
+    for activity, row in summary.iterrows():
+        plt.text(row['HoursPerWeek'] + 0.1, row['Satisfaction'], activity, fontsize=9)
+
+    plt.title('Average Hours vs. Satisfaction by Activity')
+    plt.xlabel('Average Hours')
+    plt.ylabel('Average Satisfaction')
+    plt.grid(True)
+    plt.tight_layout()
+    plt.show()
+
+if 'additional' in stages:
+    # Additional analysis with merged data
+    tracer.begin('ADDITIONAL ANALYSIS WITH MERGED DATA', data)
+    report.section('ADDITIONAL ANALYSIS WITH MERGED DATA',
+                   banner="\n" + "="*50 + "\nADDITIONAL ANALYSIS WITH MERGED DATA\n" + "="*50)
+
+    # Analysis 1: Average satisfaction by age group
+    age_satisfaction = cache.memoize(fingerprint, [('Age', [10, 13, 15, 18])], {'Satisfaction': 'mean'},
+                                     lambda: data.groupby('AgeGroup')['Satisfaction'].mean().round(2))
+    report.text("\nAverage Satisfaction by Age Group:")
+    report.table('satisfaction_by_age_group', age_satisfaction)
+
+    # Analysis 2: Activity participation by grade with guardian info
+    report.text("\nTop 5 most active students with guardian info:")
+    top_active = cohorts.nlargest(5, 'HoursPerWeek')[['StudentID', 'Grade', 'Activity', 'HoursPerWeek', 'GuardianName']]
+    report.table('most_active', top_active)
+
+    # Analysis 3: Correlation between stress level and hours per week
+    correlation = data['StressLevel'].corr(data['HoursPerWeek'])
+    report.value('stress_hours_correlation', correlation,
+                 f"\nCorrelation between Stress Level and Hours Per Week: {correlation:.2f}")
+
+    # Analysis 4: Average hours by activity and grade
+    activity_grade_hours = cache.memoize(fingerprint, ['Activity', 'Grade'], {'HoursPerWeek': 'mean'},
+                                         lambda: data.groupby(['Activity', 'Grade'])['HoursPerWeek'].mean().round(2))
+    report.text("\nAverage Hours by Activity and Grade:")
+    report.table('hours_by_activity_grade', activity_grade_hours)
+
+    correlation_sleep_stress = data['SleepingHours'].corr(data['StressLevel'])
+    # Print summary statistics for this relationship
+    report.value('sleep_stress_correlation', correlation_sleep_stress,
+                 f"\nCorrelation between Sleep Hours and Stress Level: {correlation_sleep_stress:.2f}")
+    sleep_stress_summary = cache.memoize(
+        fingerprint, ['StressLevel'], {'SleepingHours': ['mean', 'std', 'count']},
+        lambda: data.groupby('StressLevel')['SleepingHours'].agg(['mean', 'std', 'count']).round(2))
+    report.text("\nSleep Hours Statistics by Stress Level:")
+    report.table('sleep_by_stress_level', sleep_stress_summary)
+
+if 'additional' in stages and plots:
+    # Analysis 5: Scatter plot of Stress Level vs Sleep Hours
+    # (large inputs are drawn as 2D bins coloured by mean satisfaction)
+    plt.figure(figsize=(10, 6))
+    scatter = density_scatter(data['SleepingHours'], data['StressLevel'],
+                              c=data['Satisfaction'], cmap='viridis', s=50, alpha=0.7)
+
+    # Add colorbar
+    cbar = plt.colorbar(scatter)
+    cbar.set_label('Satisfaction Level')
+
+    # Add labels and title
+    plt.title('Relationship between Sleep Hours and Stress Level')
+    plt.xlabel('Sleeping Hours per Night')
+    plt.ylabel('Stress Level')
+    plt.grid(True, alpha=0.3)
+
+    # Add correlation coefficient
+    plt.text(0.05, 0.95, f'Correlation: {correlation_sleep_stress:.2f}',
+             transform=plt.gca().transAxes, fontsize=12,
+             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+
+    plt.tight_layout()
+    plt.show()
+
+# Students with high and low stress, shared by the stress stages below
+# (assuming 4-5 are high stress and 1-2 low stress on a 1-5 scale)
 high_stress_levels = [4, 5]
-high_stress_students = data[data['StressLevel'].isin(high_stress_levels)]
-
-print(f"\nStudents with HIGH stress (levels {high_stress_levels}):")
-print(f"Total: {len(high_stress_students)} students ({len(high_stress_students)/len(data)*100:.1f}% of total)")
-
-# Show details of high stress students
-print("\nDetails of High Stress Students:")
-high_stress_details = high_stress_students[['StudentID', 'Grade', 'Activity', 'StressLevel', 'SleepingHours', 'Satisfaction', 'GuardianName', 'GuardianContact', 'Email']]
-print(high_stress_details.to_string())
-
-# Create a focused report for high stress students with guardian details
-print("\n" + "="*70)
-print("HIGH STRESS STUDENTS REPORT - GUARDIAN CONTACT INFORMATION")
-print("="*70)
-
-for index, student in high_stress_students.iterrows():
-    print(f"\nStudent ID: {student['StudentID']}")
-    print(f"Grade: {student['Grade']}")
-    print(f"Activity: {student['Activity']}")
-    print(f"Stress Level: {student['StressLevel']}/5")
-    print(f"Sleep Hours: {student['SleepingHours']} per night")
-    print(f"Satisfaction: {student['Satisfaction']}/5")
-    print(f"Activity Hours/Week: {student['HoursPerWeek']}")
-    print("-" * 40)
-    print(f"Guardian: {student['GuardianName']}")
-    print(f"Contact: {student['GuardianContact']}")
-    print(f"Email: {student['Email']}")
-    print("=" * 70)
-
-# Average characteristics of high stress students
-print("\nAverage Characteristics of High Stress Students:")
-high_stress_avg = high_stress_students[['SleepingHours', 'Satisfaction', 'HoursPerWeek']].mean().round(2)
-print(high_stress_avg)
-
-# Comparison with low stress students
+high_stress_students = cohorts.select(cohorts.isin('StressLevel', high_stress_levels))
 low_stress_levels = [1, 2]
-low_stress_students = data[data['StressLevel'].isin(low_stress_levels)]
-print(f"\nStudents with LOW stress (levels {low_stress_levels}): {len(low_stress_students)} students")
+low_stress_students = cohorts.select(cohorts.isin('StressLevel', low_stress_levels))
 
-low_stress_avg = low_stress_students[['SleepingHours', 'Satisfaction', 'HoursPerWeek']].mean().round(2)
-print("Average Characteristics of Low Stress Students:")
-print(low_stress_avg)
-
-# Stress level distribution visualization
-plt.figure(figsize=(10, 6))
-stress_counts.plot(kind='bar', color='skyblue', edgecolor='black')
-plt.title('Distribution of Stress Levels Among Students')
-plt.xlabel('Stress Level')
-plt.ylabel('Number of Students')
-plt.xticks(rotation=0)
-plt.grid(axis='y', alpha=0.3)
-
-# Add percentage labels on bars
-for i, count in enumerate(stress_counts):
-    percentage = (count / len(data)) * 100
-    plt.text(i, count + 0.5, f'{count}\n({percentage:.1f}%)', ha='center', va='bottom')
-
-plt.tight_layout()
-plt.show()
-
-from faker import Faker
-
-fake = Faker()
+# Count students by stress level
+stress_counts = cache.memoize(fingerprint, ['StressLevel'], {'StudentID': 'size'},
+                              lambda: cohorts.counts('StressLevel'))
+
+if 'stress' in stages:
+    # Analysis 6: Students with High Stress Levels
+    tracer.begin('STRESS LEVEL ANALYSIS', data)
+    report.section('STRESS LEVEL ANALYSIS', banner="\n" + "="*50 + "\nSTRESS LEVEL ANALYSIS\n" + "="*50)
+
+    report.text("\nNumber of Students by Stress Level:")
+    report.table('students_by_stress_level', stress_counts)
+
+    report.text(f"\nStudents with HIGH stress (levels {high_stress_levels}):")
+    report.value('high_stress_total', len(high_stress_students),
+                 f"Total: {len(high_stress_students)} students ({len(high_stress_students)/len(data)*100:.1f}% of total)")
+
+    # Show details of high stress students
+    report.text("\nDetails of High Stress Students:")
+    high_stress_details = high_stress_students[['StudentID', 'Grade', 'Activity', 'StressLevel', 'SleepingHours', 'Satisfaction', 'GuardianName', 'GuardianContact', 'Email']]
+    report.table('high_stress_details', high_stress_details, high_stress_details.to_string())
+
+if 'high_stress_report' in stages:
+    # Create a focused report for high stress students with guardian details
+    tracer.begin('HIGH STRESS STUDENTS REPORT', high_stress_students)
+    report.section('HIGH STRESS STUDENTS REPORT - GUARDIAN CONTACT INFORMATION',
+                   banner="\n" + "="*70 + "\nHIGH STRESS STUDENTS REPORT - GUARDIAN CONTACT INFORMATION\n" + "="*70)
+
+    # Cards are rendered a column at a time and printed as one block
+    contact_columns = ['StudentID', 'Grade', 'Activity', 'StressLevel', 'SleepingHours', 'Satisfaction',
+                       'HoursPerWeek', 'GuardianName', 'GuardianContact', 'Email']
+    report.table('guardian_contacts', high_stress_students[contact_columns], render_report(high_stress_students))
+    if args.contacts_by:
+        paths = write_reports(high_stress_students, args.contacts_dir, args.contacts_by)
+        report.text(f"✓ Saved: {len(paths)} reports by {args.contacts_by} in {args.contacts_dir}")
+
+if 'comparison' in stages:
+    # Average characteristics of high stress students
+    tracer.begin('STRESS LEVEL COMPARISON', data)
+    report.section('STRESS LEVEL COMPARISON', banner='')
+    report.text("\nAverage Characteristics of High Stress Students:")
+    high_stress_avg = cache.memoize(
+        fingerprint, [], {'SleepingHours': 'mean', 'Satisfaction': 'mean', 'HoursPerWeek': 'mean'},
+        lambda: high_stress_students[['SleepingHours', 'Satisfaction', 'HoursPerWeek']].mean().round(2),
+        filters={'StressLevel': high_stress_levels})
+    report.table('high_stress_averages', high_stress_avg)
+
+    # Comparison with low stress students
+    report.value('low_stress_total', len(low_stress_students),
+                 f"\nStudents with LOW stress (levels {low_stress_levels}): {len(low_stress_students)} students")
+
+    low_stress_avg = cache.memoize(
+        fingerprint, [], {'SleepingHours': 'mean', 'Satisfaction': 'mean', 'HoursPerWeek': 'mean'},
+        lambda: low_stress_students[['SleepingHours', 'Satisfaction', 'HoursPerWeek']].mean().round(2),
+        filters={'StressLevel': low_stress_levels})
+    report.text("Average Characteristics of Low Stress Students:")
+    report.table('low_stress_averages', low_stress_avg)
+
+if 'comparison' in stages and plots:
+    # Stress level distribution visualization
+    plt.figure(figsize=(10, 6))
+    stress_counts.plot(kind='bar', color='skyblue', edgecolor='black')
+    plt.title('Distribution of Stress Levels Among Students')
+    plt.xlabel('Stress Level')
+    plt.ylabel('Number of Students')
+    plt.xticks(rotation=0)
+    plt.grid(axis='y', alpha=0.3)
+
+    # Add percentage labels on bars
+    for i, count in enumerate(stress_counts):
+        percentage = (count / len(data)) * 100
+        plt.text(i, count + 0.5, f'{count}\n({percentage:.1f}%)', ha='center', va='bottom')
+
+    plt.tight_layout()
+    plt.show()
+
+report.finish()
+tracer.finish()
+cache.finish()
+
+# Faker scratchpad, kept out of the analysis run (Faker is a slow import):
+# from faker import Faker
+# fake = Faker()
 
 # print(fake.name())        # Random full name
 # print(fake.address())     # Random address
@@ -0,0 +1,185 @@
+import numpy as np
+import pandas as pd
+
+# Low-cardinality student attributes that cohorts are filtered on
+INDEX_COLUMNS = ['Grade', 'Activity', 'StressLevel', 'Satisfaction', 'SleepingHours', 'AgeGroup', 'HoursPerWeek']
+
+# Roaring layout: rows are split into chunks of 2**16 by their high bits; a
+# chunk holding up to 4096 rows is a sorted uint16 array of the low bits,
+# a fuller one a 65536-bit bitset (1024 uint64 words, 8 KiB)
+CHUNK_BITS = 16
+CHUNK_SIZE = 1 << CHUNK_BITS
+ARRAY_LIMIT = 4096
+WORDS = CHUNK_SIZE // 64
+
+
+def _to_bitset(container):
+    if container.dtype == np.uint64:
+        return container
+    bits = np.zeros(CHUNK_SIZE, dtype=bool)
+    bits[container] = True
+    return np.packbits(bits, bitorder='little').view(np.uint64)
+
+
+def _to_array(bitset):
+    bits = np.unpackbits(bitset.view(np.uint8), bitorder='little')
+    return np.flatnonzero(bits).astype(np.uint16)
+
+
+def _cardinality(container):
+    if container.dtype == np.uint64:
+        return int(np.bitwise_count(container).sum())
+    return len(container)
+
+
+def _compact(container):
+    # Keep whichever form suits the chunk's cardinality; None drops an empty chunk
+    count = _cardinality(container)
+    if count == 0:
+        return None
+    if container.dtype == np.uint64 and count <= ARRAY_LIMIT:
+        return _to_array(container)
+    if container.dtype == np.uint16 and count > ARRAY_LIMIT:
+        return _to_bitset(container)
+    return container
+
+
+class Bitmap:
+    """Compressed set of row positions out of `size` rows, roaring style.
+
+    `&`, `|`, `-` and `~` combine bitmaps chunk by chunk without touching
+    the frame; array chunks use sorted-set operations, bitset chunks word
+    operations.  `len` is the row count (a popcount for bitsets).
+    """
+
+    def __init__(self, size, chunks=None):
+        self.size = size
+        self.chunks = chunks or {}
+
+    @classmethod
+    def from_positions(cls, size, positions):
+        """Bitmap of sorted, unique row positions."""
+        positions = np.asarray(positions, dtype=np.int64)
+        high = positions >> CHUNK_BITS
+        bounds = np.flatnonzero(np.r_[True, high[1:] != high[:-1], True]) if len(positions) else [0]
+        chunks = {}
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            low = (positions[start:stop] & (CHUNK_SIZE - 1)).astype(np.uint16)
+            chunks[int(high[start])] = _to_bitset(low) if len(low) > ARRAY_LIMIT else low
+        return cls(size, chunks)
+
+    def _full_chunk(self, key):
+        # Every row of chunk `key` that lies within `size`
+        rows = min(CHUNK_SIZE, self.size - key * CHUNK_SIZE)
+        if rows == CHUNK_SIZE:
+            return np.full(WORDS, np.uint64(2**64 - 1))
+        return _to_bitset(np.arange(rows, dtype=np.uint16))
+
+    def __and__(self, other):
+        chunks = {}
+        for key in self.chunks.keys() & other.chunks.keys():
+            mine, theirs = self.chunks[key], other.chunks[key]
+            if mine.dtype == np.uint16 and theirs.dtype == np.uint16:
+                container = np.intersect1d(mine, theirs, assume_unique=True)
+            elif mine.dtype == np.uint16 or theirs.dtype == np.uint16:
+                array, bitset = (mine, theirs) if mine.dtype == np.uint16 else (theirs, mine)
+                container = array[(bitset[array >> 6] >> (array & 63).astype(np.uint64)) & np.uint64(1) == 1]
+            else:
+                container = mine & theirs
+            container = _compact(container)
+            if container is not None:
+                chunks[key] = container
+        return Bitmap(self.size, chunks)
+
+    def __or__(self, other):
+        chunks = dict(self.chunks)
+        for key, theirs in other.chunks.items():
+            mine = chunks.get(key)
+            if mine is None:
+                chunks[key] = theirs
+            elif mine.dtype == np.uint16 and theirs.dtype == np.uint16:
+                chunks[key] = _compact(np.union1d(mine, theirs))
+            else:
+                chunks[key] = _compact(_to_bitset(mine) | _to_bitset(theirs))
+        return Bitmap(self.size, chunks)
+
+    def __invert__(self):
+        chunks = {}
+        for key in range(-(-self.size // CHUNK_SIZE)):
+            full = self._full_chunk(key)
+            container = self.chunks.get(key)
+            container = _compact(full if container is None else full & ~_to_bitset(container))
+            if container is not None:
+                chunks[key] = container
+        return Bitmap(self.size, chunks)
+
+    def __sub__(self, other):
+        return self & ~other
+
+    def __len__(self):
+        return sum(_cardinality(container) for container in self.chunks.values())
+
+    def positions(self):
+        """Row positions in ascending order, for `frame.iloc`."""
+        parts = [(np.flatnonzero(np.unpackbits(container.view(np.uint8), bitorder='little'))
+                  if container.dtype == np.uint64 else container.astype(np.int64)) + key * CHUNK_SIZE
+                 for key, container in sorted(self.chunks.items())]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+
+class BitmapIndex:
+    """One Bitmap per distinct value of each indexed column of a frame.
+
+    Built with one stable sort per column; after that, cohort filters
+    (`eq`, `isin`, combined with `&`, `|`, `-`, `~`) and their counts are
+    answered from the bitmaps alone, and only `select` reads the frame.
+    Rows with a missing value are in no bitmap of that column.  The frame
+    must not change while the index is in use.
+    """
+
+    def __init__(self, frame, columns=INDEX_COLUMNS):
+        self.frame = frame
+        self.bitmaps = {column: self._index_column(frame[column]) for column in columns}
+
+    @staticmethod
+    def _index_column(values):
+        codes, uniques = pd.factorize(values, sort=True)
+        order = np.argsort(codes, kind='stable')
+        sorted_codes = codes[order]
+        bounds = np.searchsorted(sorted_codes, np.arange(len(uniques) + 1))
+        return {value: Bitmap.from_positions(len(values), order[start:stop])
+                for value, start, stop in zip(uniques, bounds[:-1], bounds[1:])}
+
+    def values(self, column):
+        return list(self.bitmaps[column])
+
+    def eq(self, column, value):
+        return self.bitmaps[column].get(value, Bitmap(len(self.frame)))
+
+    def isin(self, column, values):
+        cohort = Bitmap(len(self.frame))
+        for value in values:
+            cohort = cohort | self.eq(column, value)
+        return cohort
+
+    def counts(self, column, cohort=None):
+        """Rows per value of `column`, optionally within `cohort`, like value_counts().sort_index()."""
+        counts = {value: len(bitmap if cohort is None else bitmap & cohort)
+                  for value, bitmap in self.bitmaps[column].items()}
+        return pd.Series(counts, name='count', dtype='int64').rename_axis(column)
+
+    def nlargest(self, n, column, cohort=None):
+        """The first `n` rows by descending `column`, ties in row order, as DataFrame.nlargest(keep='first')."""
+        parts, remaining = [], n
+        for value in sorted(self.bitmaps[column], reverse=True):
+            if remaining <= 0:
+                break
+            bitmap = self.bitmaps[column][value]
+            positions = (bitmap if cohort is None else bitmap & cohort).positions()[:remaining]
+            parts.append(positions)
+            remaining -= len(positions)
+        return self.frame.iloc[np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)]
+
+    def select(self, cohort):
+        """The cohort's rows of the frame, in frame order."""
+        return self.frame.iloc[cohort.positions()]
@@ -0,0 +1,158 @@
+import argparse
+import os
+
+import pandas as pd
+
+JOIN_KEY = 'StudentID'
+
+# Explicit dtypes, so nothing is re-inferred chunk by chunk.  GuardianContact
+# and DOB stay text: as numbers the contact would lose its leading "+".
+# Integer attributes are nullable, so a blank cell reads as <NA> instead of
+# failing the whole file.
+ACTIVITY_DTYPES = {
+    'StudentID': 'int64',
+    'Grade': 'Int64',
+    'Activity': 'str',
+    'HoursPerWeek': 'Int64',
+    'Satisfaction': 'Int64',
+    'SleepingHours': 'float64',
+    'StressLevel': 'float64',
+}
+GUARDIAN_DTYPES = {
+    'StudentID': 'int64',
+    'Age': 'Int64',
+    'DOB': 'str',
+    'Email': 'str',
+    'GuardianName': 'str',
+    'GuardianContact': 'str',
+}
+
+
+def inferred_dtypes(frame):
+    """`frame` with its nullable integer columns as read_csv would infer them on the whole file.
+
+    A column without missing values becomes int64, one with missing values
+    float64 (NaN), so reports keep their usual numpy formatting.
+    """
+    nullable = [column for column, dtype in frame.dtypes.items() if dtype == 'Int64']
+    return frame.astype({column: 'float64' if frame[column].hasnans else 'int64' for column in nullable})
+
+
+def read_chunks(path, dtypes, chunksize=100_000):
+    return pd.read_csv(path, dtype=dtypes, chunksize=chunksize)
+
+
+def is_sorted(path, on=JOIN_KEY, chunksize=1_000_000):
+    """Whether the file's `on` column never decreases, checked on that column alone."""
+    last = None
+    for chunk in pd.read_csv(path, usecols=[on], chunksize=chunksize):
+        keys = chunk[on]
+        if keys.empty:
+            continue
+        if not keys.is_monotonic_increasing or (last is not None and keys.iloc[0] < last):
+            return False
+        last = keys.iloc[-1]
+    return True
+
+
+def merge_sorted(left_chunks, right_chunks, on=JOIN_KEY):
+    """Inner sort-merge join of two chunk streams that are both sorted by `on`.
+
+    Chunks are pulled from whichever side is behind.  Keys below the
+    smallest last key of the sides still being read can get no more
+    matches, so they are joined (vectorized, per window) and released;
+    only the rows at or past that key stay buffered.
+    """
+    streams = [iter(left_chunks), iter(right_chunks)]
+    buffers = [None, None]
+    done = [False, False]
+
+    def behind(side):
+        # Sides with nothing buffered first, then the one with the smaller last key
+        buffer = buffers[side]
+        return (0, 0) if buffer is None or buffer.empty else (1, buffer[on].iloc[-1])
+
+    while not all(done):
+        side = min((side for side in (0, 1) if not done[side]), key=behind)
+        chunk = next(streams[side], None)
+        if chunk is None:
+            done[side] = True
+            if buffers[side] is None or buffers[side].empty:
+                # Nothing left on this side can match; skip the rest of the other
+                return
+        else:
+            buffers[side] = chunk if buffers[side] is None else pd.concat([buffers[side], chunk], ignore_index=True)
+
+        pending = [side for side in (0, 1) if not done[side]]
+        if not pending or any(buffers[side] is None or buffers[side].empty for side in pending):
+            continue
+        bound = min(buffers[side][on].iloc[-1] for side in pending)
+        ready = [buffer[buffer[on] < bound] for buffer in buffers]
+        buffers = [buffer[buffer[on] >= bound] for buffer in buffers]
+        if len(ready[0]) and len(ready[1]):
+            yield pd.merge(ready[0], ready[1], on=on, how='inner')
+
+    yield pd.merge(buffers[0], buffers[1], on=on, how='inner')
+
+
+def hash_join(build, probe_chunks, on=JOIN_KEY, build_left=False):
+    """Inner join of each probe chunk against an in-memory hash index of `build`.
+
+    Memory holds the build side and one probe chunk.  With `build_left`
+    the build frame's columns come first, as if it were the merge's left side.
+    """
+    index = build.set_index(on)
+    for chunk in probe_chunks:
+        joined = chunk.join(index, on=on, how='inner')
+        if build_left:
+            joined = joined[[on] + list(index.columns) + [column for column in chunk.columns if column != on]]
+        yield joined.reset_index(drop=True)
+
+
+def join_students(activities_path, guardian_path, output_path=None, chunksize=100_000):
+    """Stream the inner join of the activity and guardian files on StudentID.
+
+    Inputs sorted by StudentID are merge-joined chunk by chunk; otherwise
+    the smaller file is loaded as a hash index and the larger one streamed
+    against it.  Either way memory does not grow with both tables.  Merged
+    chunks are yielded as they are produced and, with `output_path`,
+    appended to that CSV on the way.
+    """
+    activities = lambda: read_chunks(activities_path, ACTIVITY_DTYPES, chunksize)  # noqa: E731
+    guardians = lambda: read_chunks(guardian_path, GUARDIAN_DTYPES, chunksize)  # noqa: E731
+    if is_sorted(activities_path) and is_sorted(guardian_path):
+        chunks = merge_sorted(activities(), guardians())
+    elif os.path.getsize(guardian_path) <= os.path.getsize(activities_path):
+        guardian_data = pd.read_csv(guardian_path, dtype=GUARDIAN_DTYPES)
+        chunks = hash_join(guardian_data, activities())
+    else:
+        activities_data = pd.read_csv(activities_path, dtype=ACTIVITY_DTYPES)
+        chunks = hash_join(activities_data, guardians(), build_left=True)
+
+    # An empty join still yields (and writes) the header
+    columns = list(ACTIVITY_DTYPES) + [column for column in GUARDIAN_DTYPES if column != JOIN_KEY]
+    empty = pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in {**ACTIVITY_DTYPES, **GUARDIAN_DTYPES}.items()},
+                         columns=columns)
+    first = True
+    for chunk in chunks:
+        if output_path is not None:
+            chunk.to_csv(output_path, mode='w' if first else 'a', header=first, index=False)
+        first = False
+        yield chunk
+    if first:
+        if output_path is not None:
+            empty.to_csv(output_path, index=False)
+        yield empty
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Stream the StudentID join of student activity and guardian data')
+    parser.add_argument('activities', help='student_activities.csv-shaped file')
+    parser.add_argument('guardians', help='student_guardian_data.csv-shaped file')
+    parser.add_argument('output', help='merged CSV to write')
+    parser.add_argument('--chunksize', type=int, default=100_000)
+    args = parser.parse_args()
+
+    rows = sum(len(chunk) for chunk in join_students(args.activities, args.guardians, args.output, args.chunksize))
+    print(f"Merged {rows:,} students")
+    print(f"✓ Saved: {args.output}")
@@ -0,0 +1,84 @@
+import os
+import re
+import string
+
+import numpy as np
+import pandas as pd
+
+# One card per student, as new_questions.py prints them; cards are joined by a newline
+CONTACT_CARD = ("\nStudent ID: {StudentID}\n"
+                "Grade: {Grade}\n"
+                "Activity: {Activity}\n"
+                "Stress Level: {StressLevel}/5\n"
+                "Sleep Hours: {SleepingHours} per night\n"
+                "Satisfaction: {Satisfaction}/5\n"
+                "Activity Hours/Week: {HoursPerWeek}\n"
+                + "-" * 40 + "\n"
+                "Guardian: {GuardianName}\n"
+                "Contact: {GuardianContact}\n"
+                "Email: {Email}\n"
+                + "=" * 70)
+
+# Report files can be split by these keys; a guardian is told apart by their
+# contact number, since the same name can belong to several guardians
+SPLITS = {'grade': 'Grade', 'guardian': 'GuardianContact'}
+UNSAFE = re.compile(r'[^\w+.-]')
+
+
+def _column_text(values, spec):
+    # map(str) rather than astype('str'), which keeps missing values missing;
+    # they print as "nan", as an f-string of the row would
+    if spec:
+        return values.map(lambda value: format(value, spec)).astype('str')
+    return values.map(str).astype('str')
+
+
+def render_cards(frame, template=CONTACT_CARD):
+    """One rendered card per row of `frame`, as a string Series on its index.
+
+    `template` uses str.format fields named after columns.  Each field is
+    formatted for the whole column at once and the literal text between
+    fields is added column-wise, so no row is ever boxed into a Series.
+    """
+    cards = pd.Series('', index=frame.index, dtype='str')
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if literal:
+            cards = cards + literal
+        if field is None:
+            continue
+        if conversion or field not in frame.columns:
+            raise ValueError(f"template field {{{field}}} must be a column name, optionally with a format spec")
+        cards = cards + _column_text(frame[field], spec)
+    return cards
+
+
+def render_report(frame, template=CONTACT_CARD):
+    """All cards of `frame` as one string, ready for a single write."""
+    return '\n'.join(render_cards(frame, template).tolist())
+
+
+def _file_name(prefix, split, value):
+    # Anything but word characters, "+", "." and "-" would be awkward in a file name
+    return f"{prefix}-{split}-{UNSAFE.sub('_', str(value))}.txt"
+
+
+def write_reports(frame, output_dir, split, template=CONTACT_CARD, prefix='high_stress'):
+    """Write one report file per value of `split` ('grade' or 'guardian'); returns the paths.
+
+    Cards are rendered once for all rows, grouped by a stable sort on the
+    key and each file is written with a single call.
+    """
+    column = SPLITS[split]
+    os.makedirs(output_dir, exist_ok=True)
+    cards = render_cards(frame, template).to_numpy(dtype=object)
+    keys = frame[column].to_numpy()
+    order = np.argsort(keys, kind='stable')
+    cards, keys = cards[order], keys[order]
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.empty(0, dtype=int)
+    paths = []
+    for start, stop in zip(starts, np.r_[starts[1:], len(keys)]):
+        path = os.path.join(output_dir, _file_name(prefix, split, keys[start]))
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(cards[start:stop]) + '\n')
+        paths.append(path)
+    return paths
@@ -0,0 +1,196 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+ACTIVITY_COLUMNS = ['StudentID', 'Grade', 'Activity', 'HoursPerWeek', 'Satisfaction', 'SleepingHours', 'StressLevel']
+GUARDIAN_COLUMNS = ['StudentID', 'Age', 'DOB', 'Email', 'GuardianName', 'GuardianContact']
+
+# Patterns of student_activities.csv: share of students, weekly hours range and
+# usual sleep per activity, and stress that falls as satisfaction rises
+ACTIVITIES = {
+    'Sports': {'share': 0.30, 'hours': (4, 8), 'sleep': 6},
+    'Gaming': {'share': 0.28, 'hours': (6, 10), 'sleep': 5},
+    'Music': {'share': 0.22, 'hours': (2, 5), 'sleep': 7},
+    'Art': {'share': 0.20, 'hours': (3, 6), 'sleep': 8},
+}
+GRADES = (9, 12)
+SATISFACTION = (3, 5)
+STRESS_BASE = 7
+
+# Students are 12-18; Indian mobile numbers start with 6, 7, 8 or 9 and have ten digits
+MIN_AGE, MAX_AGE = 12, 18
+MOBILE_LOW, MOBILE_HIGH = 6_000_000_000, 10_000_000_000
+EMAIL_DOMAINS = ['example.org', 'example.com', 'example.net']
+# Ages are counted at this date unless told otherwise, so a seed always gives
+# the same rows; the tracked student_guardian_data.csv's ages hold at it
+DEFAULT_AS_OF = '2025-09-15'
+
+
+class GuardianGenerator:
+    """Seeded, vectorized generator of student_guardian_data.csv-shaped rows.
+
+    Faker is only called while drawing the name and e-mail user pools (a
+    few thousand entries, once); every row then picks from the pools and
+    draws its age, birth date and phone number as NumPy arrays.  A block
+    depends only on the seed, its first StudentID and the reference date,
+    so the same call always returns the same rows however the IDs are cut.
+    """
+
+    def __init__(self, seed=0, pool_size=1_000, as_of=DEFAULT_AS_OF):
+        from faker import Faker
+
+        self.seed = seed
+        # Ages are counted at this date, as Faker's date_of_birth does with today
+        self.as_of = np.datetime64(as_of, 'D')
+        fake = Faker()
+        fake.seed_instance(seed)
+        self.names = np.array([fake.name() for _ in range(pool_size)])
+        self.users = np.array([fake.user_name() for _ in range(pool_size)])
+        self.domains = np.array(EMAIL_DOMAINS)
+
+    def _years_before(self, years):
+        # The as_of month and day, `years` earlier (29 February becomes 28 February)
+        year = self.as_of.astype('datetime64[Y]')
+        month = self.as_of.astype('datetime64[M]')
+        months = (year - years).astype('datetime64[M]') + (month - year.astype('datetime64[M]'))
+        day = months.astype('datetime64[D]') + (self.as_of - month.astype('datetime64[D]'))
+        return np.minimum(day, (months + 1).astype('datetime64[D]') - 1)
+
+    def _birth_dates(self, rng, age):
+        # Anyone born in (as_of - (age + 1) years, as_of - age years] is `age` at as_of
+        latest = self._years_before(age)
+        span = (latest - self._years_before(age + 1)).astype(np.int64)
+        return latest - (rng.random(len(age)) * span).astype(np.int64)
+
+    def generate(self, count, start_id=1):
+        """Columns of `count` guardian rows with StudentIDs from `start_id`, as NumPy arrays."""
+        rng = np.random.default_rng([self.seed, start_id])
+        age = rng.integers(MIN_AGE, MAX_AGE + 1, size=count)
+        user = rng.integers(len(self.users), size=count)
+        domain = rng.integers(len(self.domains), size=count)
+        student_id = np.arange(start_id, start_id + count)
+        # A ".StudentID" suffix keeps e-mails unique however few pooled user names there are
+        email_user = np.strings.add(np.strings.add(self.users[user], '.'), student_id.astype('U'))
+        return {
+            'StudentID': student_id,
+            'Age': age,
+            'DOB': self._birth_dates(rng, age),
+            'Email': np.strings.add(np.strings.add(email_user, '@'), self.domains[domain]),
+            'GuardianName': self.names[rng.integers(len(self.names), size=count)],
+            'GuardianContact': np.strings.add('+91', rng.integers(MOBILE_LOW, MOBILE_HIGH, size=count).astype('U10')),
+        }
+
+    def frame(self, count, start_id=1):
+        return pd.DataFrame(self.generate(count, start_id), columns=GUARDIAN_COLUMNS)
+
+
+class ActivityGenerator:
+    """Seeded, vectorized generator of student_activities.csv-shaped rows.
+
+    Blocks are seeded like GuardianGenerator's, on their own stream, so
+    the two files describe the same StudentIDs without sharing draws.
+    """
+
+    def __init__(self, seed=0):
+        self.seed = seed
+        self.names = np.array(list(ACTIVITIES))
+        self.shares = np.array([profile['share'] for profile in ACTIVITIES.values()])
+        self.low = np.array([profile['hours'][0] for profile in ACTIVITIES.values()])
+        self.high = np.array([profile['hours'][1] for profile in ACTIVITIES.values()])
+        self.sleep = np.array([profile['sleep'] for profile in ACTIVITIES.values()])
+
+    def generate(self, count, start_id=1):
+        """Columns of `count` activity rows with StudentIDs from `start_id`, as NumPy arrays."""
+        rng = np.random.default_rng([self.seed, start_id, 1])
+        activity = rng.choice(len(self.names), size=count, p=self.shares)
+        satisfaction = rng.integers(SATISFACTION[0], SATISFACTION[1] + 1, size=count)
+        # Now and then a student is more stressed than their satisfaction suggests
+        stress = STRESS_BASE - satisfaction + (rng.random(count) < 0.05)
+        return {
+            'StudentID': np.arange(start_id, start_id + count),
+            'Grade': rng.integers(GRADES[0], GRADES[1] + 1, size=count),
+            'Activity': self.names[activity],
+            'HoursPerWeek': rng.integers(self.low[activity], self.high[activity] + 1),
+            'Satisfaction': satisfaction,
+            'SleepingHours': self.sleep[activity],
+            'StressLevel': stress,
+        }
+
+    def frame(self, count, start_id=1):
+        return pd.DataFrame(self.generate(count, start_id), columns=ACTIVITY_COLUMNS)
+
+
+def shard_ranges(students, shards):
+    """(first StudentID, count) of each shard; the ranges are contiguous and never overlap."""
+    bounds = [students * shard // shards for shard in range(shards + 1)]
+    return [(bounds[shard] + 1, bounds[shard + 1] - bounds[shard]) for shard in range(shards)]
+
+
+def partition_paths(output_dir, shard):
+    return (os.path.join(output_dir, f'student_activities-{shard:05d}.csv'),
+            os.path.join(output_dir, f'student_guardian_data-{shard:05d}.csv'))
+
+
+def write_shard(output_dir, shard, first_id, count, seed=0, as_of=DEFAULT_AS_OF, block_rows=1_000_000):
+    """Write one shard's activity and guardian partitions, `block_rows` students at a time.
+
+    Each block is seeded from (seed, its first StudentID), so a shard's
+    files depend only on the seed, the reference date and its ID range.
+    """
+    start = time.perf_counter()
+    activities, guardians = ActivityGenerator(seed), GuardianGenerator(seed, as_of=as_of)
+    activity_path, guardian_path = partition_paths(output_dir, shard)
+    for offset in range(0, count, block_rows):
+        block = min(block_rows, count - offset)
+        mode = 'w' if offset == 0 else 'a'
+        activities.frame(block, first_id + offset).to_csv(activity_path, mode=mode, header=offset == 0, index=False)
+        guardians.frame(block, first_id + offset).to_csv(guardian_path, mode=mode, header=offset == 0, index=False)
+    return {'shard': shard, 'first_id': first_id, 'last_id': first_id + count - 1,
+            'seconds': time.perf_counter() - start}
+
+
+def _write_shard_task(task):
+    return write_shard(*task)
+
+
+def generate_shards(students, output_dir, shards=1, workers=1, seed=0, as_of=DEFAULT_AS_OF, block_rows=1_000_000):
+    """Write `students` linked activity/guardian records as `shards` partition pairs.
+
+    Shards are spread over `workers` processes, all counting ages at `as_of`.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = [(output_dir, shard, first_id, count, seed, as_of, block_rows)
+             for shard, (first_id, count) in enumerate(shard_ranges(students, shards))]
+    if workers <= 1:
+        return [write_shard(*task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_write_shard_task, tasks))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate synthetic student activity and guardian partitions')
+    parser.add_argument('students', type=int, help='number of students to generate')
+    parser.add_argument('output_dir', help='directory for the student_activities-NNNNN.csv / '
+                                           'student_guardian_data-NNNNN.csv partitions')
+    parser.add_argument('--shards', type=int, default=1, help='partition pairs to split the students into')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='processes writing shards')
+    parser.add_argument('--block-rows', type=int, default=1_000_000, help='students generated at a time per shard')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--as-of', default=DEFAULT_AS_OF,
+                        help=f'date the ages are counted at (YYYY-MM-DD, default {DEFAULT_AS_OF})')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = generate_shards(args.students, args.output_dir, args.shards, args.workers, args.seed, args.as_of,
+                              args.block_rows)
+    for result in results:
+        print(f"✓ Shard {result['shard']:05d}: StudentID {result['first_id']:,}-{result['last_id']:,} "
+              f"in {result['seconds']:.1f}s")
+    elapsed = time.perf_counter() - start
+    print(f"Generated {args.students:,} students in {elapsed:.1f}s ({args.students / elapsed:,.0f} students/s)")
+    print(f"✓ Saved: {args.output_dir}")
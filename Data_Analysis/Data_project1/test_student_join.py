@@ -0,0 +1,38 @@
+import pandas as pd
+
+from student_join import inferred_dtypes, join_students
+
+ACTIVITIES = """StudentID,Grade,Activity,HoursPerWeek,Satisfaction,SleepingHours,StressLevel
+{first},9,Art,5,4,7.5,3
+{second},,Sports,,5,8.0,2
+"""
+GUARDIANS = """StudentID,Age,DOB,Email,GuardianName,GuardianContact
+1,14,2010-01-01,a@example.com,Ann Lee,+1-555-0100
+2,,2009-05-05,b@example.com,Bo Chan,+1-555-0101
+"""
+
+
+def _join(tmp_path, first, second):
+    activities = tmp_path / 'activities.csv'
+    guardians = tmp_path / 'guardians.csv'
+    activities.write_text(ACTIVITIES.format(first=first, second=second))
+    guardians.write_text(GUARDIANS)
+    return pd.concat(join_students(str(activities), str(guardians)), ignore_index=True).sort_values('StudentID')
+
+
+def test_blank_integer_cells_read_as_missing(tmp_path):
+    # Sorted inputs take the merge join, unsorted ones the hash join
+    for first, second in [(1, 2), (2, 1)]:
+        merged = _join(tmp_path, first, second).set_index('StudentID')
+        row = merged.loc[2 if second == 2 else 1]
+        assert len(merged) == 2
+        assert merged['Grade'].dtype == 'Int64'
+        assert pd.isna(row['Grade']) and pd.isna(row['HoursPerWeek'])
+        assert pd.isna(merged.loc[2, 'Age'])
+
+
+def test_inferred_dtypes_match_read_csv(tmp_path):
+    merged = inferred_dtypes(_join(tmp_path, 1, 2))
+    assert merged['Grade'].dtype == 'float64'
+    assert merged['Satisfaction'].dtype == 'int64'
+    assert merged['Age'].dtype == 'float64'
@@ -1,244 +1,322 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
-
-# Set style for better plots
-plt.style.use('default')
-sns.set_palette("husl")
-
-# Load CSV file into a DataFrame
-df = pd.read_csv('Sample_Superstore.csv', encoding='ISO-8859-1')
-
-# Convert date columns to datetime
-df['Order Date'] = pd.to_datetime(df['Order Date'])
-df['Ship Date'] = pd.to_datetime(df['Ship Date'])
-
-print("=== REGIONAL SALES ANALYSIS ===")
-print(f"Dataset shape: {df.shape}")
-print(f"Date range: {df['Order Date'].min()} to {df['Order Date'].max()}")
-print()
-
-# Basic sales statistics
-total_sales = df['Sales'].sum()
-total_orders = df['Order ID'].nunique()
-
-print("=== BASIC SALES STATISTICS ===")
-print(f"Total Sales: ${total_sales:,.2f}")
-print(f"Total Orders: {total_orders:,}")
-print()
-
-# Sales by Region - Overview
-print("=== SALES DISTRIBUTION BY REGION ===")
-region_sales = df.groupby('Region').agg({
-    'Sales': 'sum',
-    'Quantity': 'sum',
-    'Order ID': 'nunique',
-    'Customer ID': 'nunique'
-}).round(2)
-
-region_sales['Avg_Order_Value'] = (region_sales['Sales'] / region_sales['Order ID']).round(2)
-region_sales['Sales_Percentage'] = (region_sales['Sales'] / total_sales * 100).round(2)
-region_sales['Customers_Percentage'] = (region_sales['Customer ID'] / region_sales['Customer ID'].sum() * 100).round(2)
-region_sales = region_sales.sort_values('Sales', ascending=False)
-
-print(region_sales)
-print()
-
-# Detailed Regional Analysis
-print("=== DETAILED REGIONAL ANALYSIS ===")
-regions = region_sales.index.tolist()
-
-for region in regions:
-    print(f"\n{'='*60}")
-    print(f"REGION: {region.upper()}")
-    print('='*60)
-
-    # Filter data for this region
-    region_data = df[df['Region'] == region]
-
-    # Sales statistics for this region
-    region_total_sales = region_data['Sales'].sum()
-    region_orders = region_data['Order ID'].nunique()
-    region_customers = region_data['Customer ID'].nunique()
-
-    print("Region Overview:")
-    print(f"   - Total Sales: ${region_total_sales:,.2f}")
-    print(f"   - Total Orders: {region_orders:,}")
-    print(f"   - Total Customers: {region_customers:,}")
-    print(f"   - Avg Order Value: ${region_total_sales/region_orders:.2f}")
-    print(f"   - % of Total Sales: {region_total_sales/total_sales*100:.1f}%")
-
-    # Top categories in this region
-    print("\nTop Categories:")
-    region_categories = region_data.groupby('Category').agg({
-        'Sales': 'sum',
-        'Quantity': 'sum'
-    }).round(2).sort_values('Sales', ascending=False)
-
-    for idx, (category, data) in enumerate(region_categories.iterrows(), 1):
-        print(f"   {idx}. {category}: ${data['Sales']:,.2f} ({data['Sales']/region_total_sales*100:.1f}% of region sales)")
-
-    # Top sub-categories in this region
-    print("\nTop Sub-Categories:")
-    region_subcats = region_data.groupby('Sub-Category').agg({
-        'Sales': 'sum',
-        'Quantity': 'sum'
-    }).round(2).sort_values('Sales', ascending=False).head(5)
-
-    for idx, (subcat, data) in enumerate(region_subcats.iterrows(), 1):
-        print(f"   {idx}. {subcat}: ${data['Sales']:,.2f} ({data['Sales']/region_total_sales*100:.1f}% of region sales)")
-
-    # Top products in this region
-    print("\nTop Products:")
-    region_products = region_data.groupby('Product Name').agg({
-        'Sales': 'sum',
-        'Quantity': 'sum',
-        'Order ID': 'nunique'
-    }).round(2).sort_values('Sales', ascending=False).head(5)
-
-    for idx, (product, data) in enumerate(region_products.iterrows(), 1):
-        print(f"   {idx}. {product}: ${data['Sales']:,.2f} ({data['Quantity']:.0f} units, {data['Order ID']} orders)")
-
-    # Top states in this region
-    print("\nTop States:")
-    region_states = region_data.groupby('State').agg({
-        'Sales': 'sum'
-    }).round(2).sort_values('Sales', ascending=False).head(3)
-
-    for idx, (state, data) in enumerate(region_states.iterrows(), 1):
-        print(f"   {idx}. {state}: ${data['Sales']:,.2f}")
-
-    # Customer segments in this region
-    print("\nCustomer Segments:")
-    region_segments = region_data.groupby('Segment').agg({
-        'Sales': 'sum'
-    }).round(2).sort_values('Sales', ascending=False)
-
-    for segment, data in region_segments.iterrows():
-        print(f"   - {segment}: ${data['Sales']:,.2f} ({data['Sales']/region_total_sales*100:.1f}% of region sales)")
-
-print(f"\n{'='*60}")
-print("REGIONAL COMPARISON SUMMARY")
-print('='*60)
-
-# Regional preferences comparison
-print("\nTop Category by Region:")
-for region in regions:
-    region_data = df[df['Region'] == region]
-    top_category = region_data.groupby('Category')['Sales'].sum().idxmax()
-    top_category_sales = region_data.groupby('Category')['Sales'].sum().max()
-    print(f"   - {region}: {top_category}")
-
-print("\nTop Sub-Category by Region:")
-for region in regions:
-    region_data = df[df['Region'] == region]
-    top_subcat = region_data.groupby('Sub-Category')['Sales'].sum().idxmax()
-    top_subcat_sales = region_data.groupby('Sub-Category')['Sales'].sum().max()
-    print(f"   - {region}: {top_subcat}")
-
-print("\nTop Product by Region:")
-for region in regions:
-    region_data = df[df['Region'] == region]
-    top_product = region_data.groupby('Product Name')['Sales'].sum().idxmax()
-    top_product_sales = region_data.groupby('Product Name')['Sales'].sum().max()
-    print(f"   - {region}: {top_product}")
-
-# Create visualizations
-print("\n=== CREATING VISUALIZATIONS ===")
-
-# Sales by Region
-plt.figure(figsize=(10, 6))
-region_sales['Sales'].plot(kind='pie', autopct='%1.1f%%', startangle=90)
-plt.title('Sales Distribution by Region')
-plt.ylabel('')
-plt.tight_layout()
-plt.savefig('regional_sales_distribution.png', dpi=300, bbox_inches='tight')
-print("✓ Saved: regional_sales_distribution.png")
-
-# Regional comparison bar chart
-plt.figure(figsize=(12, 6))
-region_sales['Sales'].plot(kind='bar', color='skyblue')
-plt.title('Sales by Region')
-plt.ylabel('Sales ($)')
-plt.xticks(rotation=45)
-plt.tight_layout()
-plt.savefig('regional_sales_comparison.png', dpi=300, bbox_inches='tight')
-print("✓ Saved: regional_sales_comparison.png")
-
-# Top categories by region
-plt.figure(figsize=(14, 8))
-regions_list = []
-categories_list = []
-sales_list = []
-
-for region in regions:
-    region_data = df[df['Region'] == region]
-    top_cats = region_data.groupby('Category')['Sales'].sum().sort_values(ascending=False).head(3)
-    for cat in top_cats.index:
-        regions_list.append(region)
-        categories_list.append(cat)
-        sales_list.append(top_cats[cat])
-
-regional_cats_df = pd.DataFrame({
-    'Region': regions_list,
-    'Category': categories_list,
-    'Sales': sales_list
-})
-
-pivot_df = regional_cats_df.pivot(index='Region', columns='Category', values='Sales').fillna(0)
-
-pivot_df.plot(kind='bar', figsize=(14, 8))
-plt.title('Top Categories by Region')
-plt.ylabel('Sales ($)')
-plt.xticks(rotation=45)
-plt.legend(title='Category', bbox_to_anchor=(1.05, 1), loc='upper left')
-plt.tight_layout()
-plt.savefig('regional_category_comparison.png', dpi=300, bbox_inches='tight')
-print("✓ Saved: regional_category_comparison.png")
-
-# Top sub-categories by region
-plt.figure(figsize=(16, 10))
-regions_list = []
-subcats_list = []
-sales_list = []
-
-for region in regions:
-    region_data = df[df['Region'] == region]
-    top_subcats = region_data.groupby('Sub-Category')['Sales'].sum().sort_values(ascending=False).head(5)
-    for subcat in top_subcats.index:
-        regions_list.append(region)
-        subcats_list.append(subcat)
-        sales_list.append(top_subcats[subcat])
-
-regional_subcats_df = pd.DataFrame({
-    'Region': regions_list,
-    'Sub_Category': subcats_list,
-    'Sales': sales_list
-})
-
-# Create a grouped bar chart with regions on x-axis and sub-categories as legend
-regional_subcats_pivot = regional_subcats_df.pivot_table(
-    index='Region',
-    columns='Sub_Category',
-    values='Sales',
-    aggfunc='sum'
-).fillna(0)
-
-regional_subcats_pivot.plot(kind='bar', figsize=(16, 10))
-plt.title('Top Sub-Categories by Region')
-plt.ylabel('Sales ($)')
-plt.xlabel('Region')
-plt.xticks(rotation=45)
-plt.legend(title='Sub-Category', bbox_to_anchor=(1.05, 1), loc='upper left')
-plt.tight_layout()
-plt.savefig('regional_subcategory_comparison.png', dpi=300, bbox_inches='tight')
-print("✓ Saved: regional_subcategory_comparison.png")
-
-print("\n=== ANALYSIS COMPLETE ===")
-print("All visualizations have been saved as PNG files.")
-print("Key files created:")
-print("- regional_sales_distribution.png")
-print("- regional_sales_comparison.png")
-print("- regional_category_comparison.png")
-print("- regional_subcategory_comparison.png")
+import argparse
+import functools
+import os
+import sys
+
+# Shared helpers of the Data_Analysis projects live one level up
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from analysis_report import Report, text_emitter  # noqa: E402
+from analysis_trace import StageTracer  # noqa: E402
+from result_cache import ResultCache, dataset_fingerprint  # noqa: E402
+
+# Report sections in output order, selectable with --stages
+STAGES = {
+    'overview': 'dataset shape, date range and sales/order totals',
+    'region_summary': 'sales distribution by region',
+    'regional_detail': 'per-region categories, products, states and segments',
+    'top_products': 'top category, sub-category and product of each region',
+    'trends': 'yearly sales and profit from the rollup store',
+    'shipping': 'p50/p90/p99 days to ship by Ship Mode, Region and State',
+    'charts': 'PNG charts (skipped by --no-plots)',
+}
+
+# Part of every result-cache key; bump it when a cached aggregate or report
+# text would come out differently, so entries of older code are not served
+CACHE_VERSION = 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Regional sales analysis of the superstore dataset')
+    parser.add_argument('--source', default='Sample_Superstore.csv',
+                        help='superstore CSV, or a .zip/.gz/.zst archive of CSV members read without extracting '
+                             '(e.g. ../archive.zip)')
+    parser.add_argument('--read-workers', type=int, default=1,
+                        help='threads decompressing the members of a multi-member archive in parallel')
+    parser.add_argument('--stream', action='store_true',
+                        help='read the CSV in chunks and keep only mergeable aggregates in memory')
+    parser.add_argument('--incremental', action='store_true',
+                        help='fold only rows past the stored Row ID watermark into the stored aggregates')
+    parser.add_argument('--approx', action='store_true',
+                        help='estimate distinct counts and top products/states with mergeable sketches')
+    parser.add_argument('--chunksize', type=int, default=100_000,
+                        help='rows per chunk in --stream mode')
+    parser.add_argument('--memory-report', action='store_true',
+                        help='print per-column memory with default dtypes versus the compact schema')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='processes used for the per-region detailed sections and the charts')
+    parser.add_argument('--engine', choices=['pandas', 'duckdb', 'sqlite'], default='pandas',
+                        help='run the aggregations out of core in DuckDB or SQLite instead of pandas')
+    parser.add_argument('--stages', default=','.join(STAGES),
+                        help='comma-separated sections to run: ' + '; '.join(f'{name} ({what})' for name, what in STAGES.items()))
+    parser.add_argument('--no-plots', action='store_true', help='skip the charts stage; matplotlib is never imported')
+    args = parser.parse_args()
+    stages = [stage for stage in args.stages.split(',') if stage]
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        parser.error(f"unknown stage(s) {', '.join(unknown)}; choose from {', '.join(STAGES)}")
+    # Keep the report order whatever order the stages were given in
+    stages = [stage for stage in STAGES if stage in stages and not (stage == 'charts' and args.no_plots)]
+    if args.incremental and (args.stream or args.approx):
+        parser.error('--incremental cannot be combined with --stream or --approx')
+    if args.engine != 'pandas' and (args.stream or args.approx or args.incremental):
+        parser.error('--engine cannot be combined with --stream, --approx or --incremental')
+
+    tracer = StageTracer.from_env('store_analysis.py')
+    cache = ResultCache.from_env('store_analysis.py')
+    # Everything below is collected here and written in one pass at the end
+    report = Report.from_env('Regional Sales Analysis')
+
+    # A text report of exact aggregates is a pure function of the CSV, so each
+    # stage's rendered text is cached; when every selected stage is cached the
+    # run replays them without importing pandas at all.  Charts are excluded
+    # since their PNGs live outside the cache, and trends since they are read
+    # from the persistent rollup store rather than computed from the CSV.
+    # Each engine sums in its own order, so its results are cached apart
+    computed = {'engine': args.engine, 'version': CACHE_VERSION}
+    replayable = report.fmt == 'text' and not (args.stream or args.incremental or args.approx or args.memory_report)
+    if replayable:
+        fingerprint = dataset_fingerprint(args.source)
+        stage_keys = {stage: cache.key(fingerprint, [stage], 'text', computed)
+                      for stage in stages if stage not in ('charts', 'trends')}
+        if len(stage_keys) == len(stages):
+            cached = [cache.get(stage_keys[stage]) for stage in stages]
+            if all(found for found, _ in cached):
+                for stage, (_, text) in zip(stages, cached):
+                    report.section(stage, banner='').text(text)
+                report.finish()
+                tracer.finish()
+                cache.finish()
+                return
+
+    # Heavy modules are only imported once something has to be computed
+    from store_cube import DIMENSIONS, METRICS, RegionCube
+    from store_latency import LATENCY_DIMENSIONS, QUANTILES, LatencyAccumulator
+    from store_archive import is_archive
+    from store_loader import iter_superstore_chunks, load_superstore, memory_report
+    from store_regions import region_sections
+    from store_rollups import KEYS, MEASURES, RollupStore, daily_totals
+
+    if args.incremental and is_archive(args.source):
+        # The Row ID watermark is a byte offset into the plain file
+        parser.error('--incremental needs a plain CSV --source, not an archive')
+
+    # What a RegionCube aggregates, as part of its result-cache key
+    CUBE_METRICS = {**{metric: 'sum' for metric in METRICS}, 'Order ID': 'nunique', 'Customer ID': 'nunique'}
+
+    if args.memory_report:
+        report.section('MEMORY BY COLUMN (default dtypes vs compact schema)')
+        memory = memory_report(args.source)
+        report.table('memory_by_column', memory, memory.to_string())
+        report.text()
+
+    # Build the Region x dimension cube once; every section below is sliced from it
+    tracer.begin('LOAD AND AGGREGATE')
+    # Taken before reading, so it never claims rows appended while the run reads
+    fingerprint = dataset_fingerprint(args.source)
+    if args.incremental:
+        # Incremental mode: only rows appended since the last run are read
+        from store_incremental import IncrementalIngest
+        ingest = IncrementalIngest(args.source)
+        chunks = ingest.new_chunks(args.chunksize)
+    elif args.stream:
+        # Streaming mode: memory is bounded by chunk size plus group cardinality
+        chunks = iter_superstore_chunks(args.source, args.chunksize, args.read_workers)
+    else:
+        # Unchanged data is answered from the result cache; the rows (or the
+        # database) are only touched when an aggregate below is missing
+        @functools.cache
+        def backend():
+            # SQL mode: the database scans the data; only grouped results are loaded
+            from store_sql import SqlBackend
+            return SqlBackend(args.source, args.engine, args.chunksize)
+
+        @functools.cache
+        def superstore():
+            # Load the data through the typed columnar cache (dates parsed, strings categorized)
+            df = load_superstore(args.source, workers=args.read_workers)
+            tracer.observe(df)
+            return df
+
+    # The persistent trend rollups of this source; every mode syncs them to the
+    # daily totals of the whole dataset, keyed by its fingerprint
+    rollups = RollupStore.for_source(args.source)
+    if args.stream:
+        chunks = rollups.tracking(chunks)
+    # Days-to-ship sketches are fed from the same pass over the rows
+    latency = LatencyAccumulator()
+    if args.stream and 'shipping' in stages:
+        chunks = latency.tracking(chunks)
+
+    if args.incremental:
+        # Appended rows are folded into the stored aggregates, daily totals included
+        for chunk in chunks:
+            pass
+        ingest.commit()
+        rollups.sync(ingest.days, fingerprint)
+        cube = ingest.accumulator.to_cube()
+    elif args.approx:
+        # Approximate mode: HyperLogLog distinct counts, sketched product/state rankings
+        from store_sketches import SketchAccumulator
+        accumulator = SketchAccumulator()
+        for chunk in chunks if args.stream else rollups.tracking([superstore()]):
+            accumulator.add(chunk)
+            if not args.stream and 'shipping' in stages:
+                latency.add(chunk)
+        cube = accumulator.to_cube()
+    elif args.stream:
+        cube = RegionCube.from_chunks(chunks)
+    elif args.engine != 'pandas':
+        cube = cache.memoize(fingerprint, ['Region'] + DIMENSIONS, CUBE_METRICS, lambda: backend().cube(), computed)
+        days = cache.memoize(fingerprint, ['Order Date'] + KEYS, MEASURES, lambda: backend().daily_totals(), computed)
+        rollups.sync(days, fingerprint)
+    else:
+        cube = cache.memoize(fingerprint, ['Region'] + DIMENSIONS, CUBE_METRICS,
+                             lambda: RegionCube.from_frame(superstore()), computed)
+        days = cache.memoize(fingerprint, ['Order Date'] + KEYS, MEASURES, lambda: daily_totals(superstore()), computed)
+        rollups.sync(days, fingerprint)
+    rollups.commit(fingerprint)
+
+    if 'shipping' not in stages:
+        shipping = None
+    elif args.incremental:
+        shipping = ingest.latency.tables()
+    elif args.stream or args.approx:
+        shipping = latency.tables()
+    else:
+        source = backend().shipping_days if args.engine != 'pandas' else superstore
+        shipping = cache.memoize(fingerprint, LATENCY_DIMENSIONS, {'Days to Ship': list(QUANTILES)},
+                                 lambda: latency.add(source()).tables(), computed)
+
+    # Shared by several stages
+    total_sales = cube.summary['total_sales']
+    total_orders = cube.summary['total_orders']
+    region_totals = cube.region_totals()
+    region_sales = region_totals.round(2)
+
+    region_sales['Avg_Order_Value'] = (region_sales['Sales'] / region_sales['Order ID']).round(2)
+    region_sales['Sales_Percentage'] = (region_sales['Sales'] / total_sales * 100).round(2)
+    region_sales['Customers_Percentage'] = (region_sales['Customer ID'] / region_sales['Customer ID'].sum() * 100).round(2)
+    region_sales = region_sales.sort_values('Sales', ascending=False)
+    regions = region_sales.index.tolist()
+
+    # Where each stage's sections start in the report, for caching their text
+    stage_starts = {}
+
+    if 'overview' in stages:
+        stage_starts['overview'] = len(report.sections)
+        tracer.begin('REGIONAL SALES ANALYSIS')
+        report.section('REGIONAL SALES ANALYSIS')
+        report.value('shape', cube.summary['shape'], f"Dataset shape: {cube.summary['shape']}")
+        report.value('date_range', [cube.summary['date_min'], cube.summary['date_max']],
+                     f"Date range: {cube.summary['date_min']} to {cube.summary['date_max']}")
+        report.text()
+
+        # Basic sales statistics
+        tracer.begin('BASIC SALES STATISTICS')
+        report.section('BASIC SALES STATISTICS')
+        report.value('total_sales', total_sales, f"Total Sales: ${total_sales:,.2f}")
+        report.value('total_orders', total_orders, f"Total Orders: {total_orders:,}")
+        if args.approx:
+            report.value('distinct_error', cube.summary['distinct_error'],
+                         f"(Order and customer counts are HyperLogLog estimates, ±{cube.summary['distinct_error']*100:.1f}% standard error;")
+            report.text(" top products and states are sketch estimates with their maximum over-count shown as ±)")
+        report.text()
+
+    # Sales by Region - Overview
+    if 'region_summary' in stages:
+        stage_starts['region_summary'] = len(report.sections)
+        tracer.begin('SALES DISTRIBUTION BY REGION')
+        report.section('SALES DISTRIBUTION BY REGION')
+        report.table('region_sales', region_sales)
+        report.text()
+
+    # Detailed Regional Analysis
+    if 'regional_detail' in stages:
+        stage_starts['regional_detail'] = len(report.sections)
+        tracer.begin('DETAILED REGIONAL ANALYSIS', region_sales)
+        report.section('DETAILED REGIONAL ANALYSIS')
+        report.extend(region_sections(cube, region_totals, regions, total_sales, approx=args.approx, workers=args.workers))
+
+    if 'top_products' in stages:
+        stage_starts['top_products'] = len(report.sections)
+        tracer.begin('REGIONAL COMPARISON SUMMARY', region_sales)
+        report.section('REGIONAL COMPARISON SUMMARY', banner=f"\n{'='*60}\nREGIONAL COMPARISON SUMMARY\n{'='*60}")
+
+        # Regional preferences comparison
+        for dim, label in [('Category', 'Top Category'), ('Sub-Category', 'Top Sub-Category'),
+                           ('Product Name', 'Top Product')]:
+            top_by_region = cube.top(dim).set_index('Region').loc[regions]
+            report.text(f"\n{label} by Region:")
+            report.table(f"top_{dim}", top_by_region, '\n'.join(
+                f"   - {region}: {top_by_region.loc[region, dim]}" for region in regions))
+
+    # Trends are read from the rollup store only, never from the order rows
+    if 'trends' in stages:
+        stage_starts['trends'] = len(report.sections)
+        tracer.begin('SALES AND PROFIT TRENDS', rollups.levels['daily'])
+        report.section('SALES AND PROFIT TRENDS', banner="\n=== SALES AND PROFIT TRENDS ===")
+        yearly_trend = rollups.trend('yearly')
+        yearly_trend.index = yearly_trend.index.year
+        report.table('yearly_trend', yearly_trend.round(2))
+
+    # Fulfilment latency, from mergeable quantile sketches (exact for groups under k lines)
+    if 'shipping' in stages:
+        stage_starts['shipping'] = len(report.sections)
+        tracer.begin('SHIPPING LATENCY')
+        report.section('SHIPPING LATENCY', banner="\n=== SHIPPING LATENCY (days from order to shipment) ===")
+        overall = shipping['All'].iloc[0]
+        report.value('overall', overall.to_dict(),
+                     f"All order lines ({overall['Lines']:,}): " + ', '.join(f"{q} {overall[q]}" for q in QUANTILES) + " days")
+        report.text(f"(groups of more than {latency.k} lines are KLL sketch estimates, ranks within about 1.7%)")
+        for dim in ['Ship Mode', 'Region']:
+            report.text(f"\nBy {dim}:")
+            report.table(f"by_{dim}", shipping[dim])
+        # All states go to the structured report; the console lists the slowest ones
+        slowest_states = shipping['State'].sort_values(list(reversed(QUANTILES)) + ['Lines'], ascending=False)
+        report.text("\nSlowest 10 States (by p99, then p90 and p50):")
+        report.table('by_State', shipping['State'], slowest_states.head(10).to_string())
+
+    # Create visualizations
+    if 'charts' in stages:
+        stage_starts['charts'] = len(report.sections)
+        from store_charts import (category_comparison_bar, monthly_profit_trend, monthly_sales_trend, render_charts,
+                                  sales_comparison_bar, sales_distribution_pie, subcategory_comparison_bar)
+
+        tracer.begin('CREATING VISUALIZATIONS')
+        report.section('CREATING VISUALIZATIONS', banner="\n=== CREATING VISUALIZATIONS ===")
+
+        # Chart inputs are sliced from the cube; the figures are drawn in parallel and
+        # only when their input aggregate changed since the last run
+        pivot_df = cube.top_pivot('Category', 3)
+        regional_subcats_pivot = cube.top_pivot('Sub-Category', 5, column='Sub_Category')
+        monthly_trend = rollups.trend('monthly')
+
+        charts = [
+            (sales_distribution_pie, region_sales[['Sales']], 'regional_sales_distribution.png'),
+            (sales_comparison_bar, region_sales[['Sales']], 'regional_sales_comparison.png'),
+            (category_comparison_bar, pivot_df, 'regional_category_comparison.png'),
+            (subcategory_comparison_bar, regional_subcats_pivot, 'regional_subcategory_comparison.png'),
+            (monthly_sales_trend, monthly_trend[['Sales']], 'monthly_sales_trend.png'),
+            (monthly_profit_trend, monthly_trend[['Profit']], 'monthly_profit_trend.png'),
+        ]
+        for message in render_charts(charts, workers=args.workers):
+            report.text(message)
+
+        files = [path for _, _, path in charts]
+        report.section('ANALYSIS COMPLETE', banner="\n=== ANALYSIS COMPLETE ===")
+        report.text("All visualizations have been saved as PNG files.")
+        report.value('files', files, "Key files created:\n" + '\n'.join(f"- {path}" for path in files))
+
+    if replayable:
+        ends = list(stage_starts.values())[1:] + [len(report.sections)]
+        for (stage, start), end in zip(stage_starts.items(), ends):
+            if stage in stage_keys:
+                cache.put(stage_keys[stage], text_emitter(report.subset(start, end)).removesuffix('\n'))
+
+    report.finish()
+    tracer.finish()
+    cache.finish()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+import contextlib
+import fnmatch
+import gzip
+import os
+import queue
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+# Compressed sources read without extracting; a zip may hold several CSV members
+ZIP_SUFFIXES = ('.zip',)
+GZIP_SUFFIXES = ('.gz', '.gzip')
+ZSTD_SUFFIXES = ('.zst', '.zstd')
+
+# Chunks each reader thread may have parsed ahead of the consumer
+READ_AHEAD = 2
+
+
+def is_archive(path):
+    return path.lower().endswith(ZIP_SUFFIXES + GZIP_SUFFIXES + ZSTD_SUFFIXES)
+
+
+def archive_members(path, pattern='*.csv'):
+    """Names of the CSV members of `path` in archive order; gzip and zstd files hold exactly one."""
+    if path.lower().endswith(ZIP_SUFFIXES):
+        with zipfile.ZipFile(path) as archive:
+            return [info.filename for info in archive.infolist()
+                    if not info.is_dir() and fnmatch.fnmatch(info.filename.lower(), pattern)]
+    return [os.path.splitext(os.path.basename(path))[0]]
+
+
+def _open_zstd(path):
+    try:
+        from compression import zstd  # standard library from Python 3.14
+        return zstd.open(path, 'rb')
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(f"reading {path} needs the zstandard package (pip install zstandard)") from None
+    # Multi-frame files (as written by pzstd or appended exports) read as one stream
+    return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), read_across_frames=True)
+
+
+@contextlib.contextmanager
+def open_member(path, member=None):
+    """Binary stream of one member (default: the first CSV), decompressed as it is read."""
+    lower = path.lower()
+    if lower.endswith(ZIP_SUFFIXES):
+        # Each stream gets its own ZipFile handle, so threads never share a file position
+        with zipfile.ZipFile(path) as archive:
+            if member is None:
+                member = archive_members(path)[0]
+            with archive.open(member) as stream:
+                yield stream
+    elif lower.endswith(GZIP_SUFFIXES):
+        with gzip.open(path, 'rb') as stream:
+            yield stream
+    elif lower.endswith(ZSTD_SUFFIXES):
+        with _open_zstd(path) as stream:
+            yield stream
+    else:
+        raise ValueError(f"{path} is not a zip, gzip or zstd archive")
+
+
+def _read_member(path, member, read_kwargs):
+    with open_member(path, member) as stream:
+        return pd.read_csv(stream, **read_kwargs)
+
+
+def _put(out, item, stop):
+    # Blocks while the consumer is behind, but gives up once it has gone away
+    while not stop.is_set():
+        try:
+            out.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _produce_chunks(path, member, chunksize, read_kwargs, out, stop):
+    try:
+        with open_member(path, member) as stream:
+            for chunk in pd.read_csv(stream, chunksize=chunksize, **read_kwargs):
+                if not _put(out, chunk, stop):
+                    return
+    except Exception as error:
+        _put(out, error, stop)
+    finally:
+        _put(out, None, stop)
+
+
+def iter_archive_chunks(path, chunksize=100_000, workers=1, members=None, **read_kwargs):
+    """Stream the CSV members of an archive as row chunks without extracting it.
+
+    With one worker the members are read one after another.  With more,
+    up to `workers` members are decompressed and parsed at once in threads
+    (zlib and zstd release the GIL while inflating) and chunks are yielded
+    in arrival order, which suits mergeable aggregates.  At most
+    READ_AHEAD chunks per worker are held before the consumer takes them.
+    """
+    members = archive_members(path) if members is None else members
+    if workers <= 1 or len(members) <= 1:
+        for member in members:
+            with open_member(path, member) as stream:
+                yield from pd.read_csv(stream, chunksize=chunksize, **read_kwargs)
+        return
+
+    out = queue.Queue(maxsize=READ_AHEAD * workers)
+    stop = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        for member in members:
+            pool.submit(_produce_chunks, path, member, chunksize, read_kwargs, out, stop)
+        remaining = len(members)
+        while remaining:
+            item = out.get()
+            if item is None:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        stop.set()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def read_archive(path, workers=1, members=None, **read_kwargs):
+    """Read every CSV member of an archive into one frame, members in archive order.
+
+    Members are decompressed in parallel threads when `workers` > 1.  The
+    dtypes in `read_kwargs` are re-applied after concatenating, since
+    categoricals with different categories per member would fall back to
+    plain strings.
+    """
+    members = archive_members(path) if members is None else members
+    if len(members) == 1:
+        return _read_member(path, members[0], read_kwargs)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        frames = list(pool.map(lambda member: _read_member(path, member, read_kwargs), members))
+    frame = pd.concat(frames, ignore_index=True)
+    dtype = read_kwargs.get('dtype') or {}
+    return frame.astype({column: kind for column, kind in dtype.items() if column in frame})
@@ -0,0 +1,135 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from store_charts import (category_comparison_bar, render_charts, sales_comparison_bar, sales_distribution_pie,
+                          subcategory_comparison_bar)
+from store_cube import RegionCube
+from store_loader import DATE_COLUMNS, ENCODING
+from store_regions import region_sections
+from store_synthetic import GENERATOR_VERSION, SuperstoreGenerator
+
+SIZES = {'10k': 10_000, '1M': 1_000_000, '10M': 10_000_000, '50M': 50_000_000}
+STAGES = ['load', 'date_parsing', 'region_sales', 'regional_detail', 'pivots', 'charts']
+
+
+def dataset_path(data_dir, rows, seed):
+    """Generate the synthetic CSV for `rows` once and reuse it on later runs of the same generator."""
+    path = os.path.join(data_dir, f'superstore_{rows}_seed{seed}_v{GENERATOR_VERSION}.csv')
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        print(f"Generating {rows:,} rows -> {path}")
+        SuperstoreGenerator(rows, seed=seed).write_csv(path + '.partial')
+        os.replace(path + '.partial', path)
+    return path
+
+
+def run_stages(csv_path, workers=1):
+    """Time each stage of the regional report on one dataset; returns seconds per stage."""
+    timings = {}
+
+    def timed(stage, func):
+        start = time.perf_counter()
+        result = func()
+        timings[stage] = round(time.perf_counter() - start, 4)
+        return result
+
+    df = timed('load', lambda: pd.read_csv(csv_path, encoding=ENCODING))
+
+    def parse_dates():
+        for column in DATE_COLUMNS:
+            df[column] = pd.to_datetime(df[column])
+    timed('date_parsing', parse_dates)
+
+    def aggregate():
+        cube = RegionCube.from_frame(df)
+        totals = cube.region_totals()
+        return cube, totals, totals['Sales'].sum()
+    cube, region_totals, total_sales = timed('region_sales', aggregate)
+
+    regions = region_totals.sort_values('Sales', ascending=False).index.tolist()
+    timed('regional_detail', lambda: region_sections(cube, region_totals, regions, total_sales, workers=workers))
+
+    pivot_df, subcats_pivot = timed('pivots', lambda: (cube.top_pivot('Category', 3),
+                                                       cube.top_pivot('Sub-Category', 5, column='Sub_Category')))
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        charts = [
+            (sales_distribution_pie, region_totals[['Sales']], os.path.join(out_dir, 'distribution.png')),
+            (sales_comparison_bar, region_totals[['Sales']], os.path.join(out_dir, 'comparison.png')),
+            (category_comparison_bar, pivot_df, os.path.join(out_dir, 'categories.png')),
+            (subcategory_comparison_bar, subcats_pivot, os.path.join(out_dir, 'subcategories.png')),
+        ]
+        timed('charts', lambda: render_charts(charts, cache_path=os.path.join(out_dir, 'cache.json')))
+
+    timings['rows'] = len(df)
+    return timings
+
+
+def _version():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def compare(results, baseline, threshold):
+    """Stages slower than `threshold` x the baseline, as (size, stage, old, new) tuples."""
+    regressions = []
+    for size, timings in results['results'].items():
+        previous = baseline.get('results', {}).get(size, {})
+        for stage in STAGES:
+            old, new = previous.get(stage), timings.get(stage)
+            if old and new and new > old * threshold:
+                regressions.append((size, stage, old, new))
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the superstore report stages on synthetic data')
+    parser.add_argument('--sizes', default='10k', help=f"comma-separated subset of {','.join(SIZES)}")
+    parser.add_argument('--data-dir', default='bench_data', help='where generated datasets are cached')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=1, help='workers for the per-region stage')
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--baseline', help='earlier results JSON to check for regressions')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='slowdown ratio against the baseline that counts as a regression')
+    args = parser.parse_args()
+
+    results = {
+        'version': _version(),
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'seed': args.seed,
+        'generator': GENERATOR_VERSION,
+        'results': {},
+    }
+    for size in args.sizes.split(','):
+        path = dataset_path(args.data_dir, SIZES[size], args.seed)
+        timings = run_stages(path, workers=args.workers)
+        results['results'][size] = timings
+        print(f"\n=== {size} ROWS ===")
+        for stage in STAGES:
+            print(f"   - {stage}: {timings[stage]:.3f}s")
+
+    with open(args.output, 'w') as file:
+        json.dump(results, file, indent=2)
+    print(f"\n✓ Saved: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for size, stage, old, new in regressions:
+            print(f"REGRESSION {size} {stage}: {old:.3f}s -> {new:.3f}s")
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+# Rendered-input hashes of the PNGs, so unchanged figures are not drawn again
+CHART_CACHE = '.chart_cache.json'
+
+
+def _init_worker():
+    # Workers only ever write files, so use the non-interactive backend
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    plt.style.use('default')
+    sns.set_palette("husl")
+
+
+def sales_distribution_pie(region_sales, path):
+    import matplotlib.pyplot as plt
+    plt.figure(figsize=(10, 6))
+    region_sales['Sales'].plot(kind='pie', autopct='%1.1f%%', startangle=90)
+    plt.title('Sales Distribution by Region')
+    plt.ylabel('')
+    plt.tight_layout()
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    plt.close('all')
+
+
+def sales_comparison_bar(region_sales, path):
+    import matplotlib.pyplot as plt
+    plt.figure(figsize=(12, 6))
+    region_sales['Sales'].plot(kind='bar', color='skyblue')
+    plt.title('Sales by Region')
+    plt.ylabel('Sales ($)')
+    plt.xticks(rotation=45)
+    plt.tight_layout()
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    plt.close('all')
+
+
+def category_comparison_bar(pivot_df, path):
+    import matplotlib.pyplot as plt
+    pivot_df.plot(kind='bar', figsize=(14, 8))
+    plt.title('Top Categories by Region')
+    plt.ylabel('Sales ($)')
+    plt.xticks(rotation=45)
+    plt.legend(title='Category', bbox_to_anchor=(1.05, 1), loc='upper left')
+    plt.tight_layout()
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    plt.close('all')
+
+
+def subcategory_comparison_bar(regional_subcats_pivot, path):
+    import matplotlib.pyplot as plt
+    # Grouped bar chart with regions on x-axis and sub-categories as legend
+    regional_subcats_pivot.plot(kind='bar', figsize=(16, 10))
+    plt.title('Top Sub-Categories by Region')
+    plt.ylabel('Sales ($)')
+    plt.xlabel('Region')
+    plt.xticks(rotation=45)
+    plt.legend(title='Sub-Category', bbox_to_anchor=(1.05, 1), loc='upper left')
+    plt.tight_layout()
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    plt.close('all')
+
+
+def _monthly_trend(monthly, column, title, ylabel, color, path):
+    import matplotlib.pyplot as plt
+    plt.figure(figsize=(14, 6))
+    monthly[column].plot(kind='line', marker='o', linewidth=2, color=color)
+    plt.title(title)
+    plt.xlabel('Month')
+    plt.ylabel(ylabel)
+    plt.xticks(rotation=45)
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    plt.close('all')
+
+
+def monthly_sales_trend(monthly, path):
+    _monthly_trend(monthly, 'Sales', 'Monthly Sales Trend', 'Sales ($)', 'blue', path)
+
+
+def monthly_profit_trend(monthly, path):
+    _monthly_trend(monthly, 'Profit', 'Monthly Profit Trend', 'Profit ($)', 'green', path)
+
+
+def input_hash(draw, data):
+    """Fingerprint of a chart's drawing function and the aggregate it is drawn from."""
+    digest = hashlib.sha256(draw.__name__.encode())
+    if isinstance(data, pd.Series):
+        data = data.to_frame()
+    digest.update(repr((list(data.columns), list(data.index.names), list(data.dtypes.astype(str)))).encode())
+    digest.update(pd.util.hash_pandas_object(data).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def render_charts(charts, cache_path=CHART_CACHE, workers=None):
+    """Draw `(draw, data, path)` charts in a process pool, skipping unchanged ones.
+
+    A chart is skipped when its PNG exists and the hash of its input
+    aggregate matches the one recorded when it was last rendered; a single
+    pending chart, or `workers=1`, is drawn in this process.  Returns a
+    "✓ Saved" / "✓ Up to date" status line per chart for the caller's report.
+    """
+    try:
+        with open(cache_path) as file:
+            rendered = json.load(file)
+    except (OSError, ValueError):
+        rendered = {}
+
+    pending = []
+    messages = []
+    for draw, data, path in charts:
+        fingerprint = input_hash(draw, data)
+        if rendered.get(path) == fingerprint and os.path.exists(path):
+            messages.append(f"✓ Up to date: {path}")
+        else:
+            pending.append((draw, data, path, fingerprint))
+
+    if len(pending) == 1 or (pending and workers == 1):
+        # A pool would cost more to start than it saves
+        _init_worker()
+        for draw, data, path, fingerprint in pending:
+            draw(data, path)
+            rendered[path] = fingerprint
+            messages.append(f"✓ Saved: {path}")
+    elif pending:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = [(pool.submit(draw, data, path), path, fingerprint) for draw, data, path, fingerprint in pending]
+            for future, path, fingerprint in futures:
+                future.result()
+                rendered[path] = fingerprint
+                messages.append(f"✓ Saved: {path}")
+
+    if pending:
+        with open(cache_path, 'w') as file:
+            json.dump(rendered, file, indent=2)
+    return messages
@@ -0,0 +1,262 @@
+import numpy as np
+import pandas as pd
+
+# Additive measures carried by every cell of the cube
+METRICS = ['Sales', 'Quantity', 'Profit']
+
+# Dimensions the regional report breaks each region down by
+DIMENSIONS = ['Category', 'Sub-Category', 'Product Name', 'State', 'Segment']
+
+
+def merge_sums(left, right):
+    """Add two partial sum frames over the same index levels (either may be None)."""
+    if left is None:
+        return right
+    combined = pd.concat([left, right])
+    return combined.groupby(level=list(combined.index.names), observed=True, sort=False).sum()
+
+
+def _sum_parts(parts):
+    combined = pd.concat(parts)
+    return combined.groupby(level=list(combined.index.names), observed=True, sort=False).sum()
+
+
+def _distinct_parts(parts):
+    return pd.concat(parts, ignore_index=True).drop_duplicates(ignore_index=True)
+
+
+# Buffered partials are combined once they reach this many rows, or the size
+# of what has already been combined if that is larger
+COMPACT_ROWS = 1_000_000
+
+
+class PartialFrames:
+    """Partial results of chunks, combined in batches instead of on every chunk.
+
+    Folding each chunk into everything accumulated so far costs O(chunks x
+    groups).  Parts are buffered instead and `combine`d (a grouped sum, a
+    de-duplication) once they hold as many rows as the combined frame, so
+    every row is re-combined O(log chunks) times.  `combine` must be a
+    module-level function for the accumulators to pickle.
+    """
+
+    def __init__(self, combine, min_rows=COMPACT_ROWS):
+        self.combine = combine
+        self.min_rows = min_rows
+        self.parts = []
+        self.compacted_rows = 0
+        self.buffered_rows = 0
+
+    def add(self, frame):
+        self.parts.append(frame)
+        self.buffered_rows += len(frame)
+        if self.buffered_rows >= max(self.min_rows, self.compacted_rows):
+            self.compact()
+        return self
+
+    def merge(self, other):
+        for frame in other.parts:
+            self.add(frame)
+        return self
+
+    def compact(self):
+        if len(self.parts) > 1:
+            self.parts = [self.combine(self.parts)]
+        self.compacted_rows = len(self.parts[0]) if self.parts else 0
+        self.buffered_rows = 0
+        return self
+
+    def value(self):
+        """The combined frame, or None when nothing was added."""
+        return self.compact().parts[0] if self.parts else None
+
+
+def _largest(values, n):
+    """Positions of the `n` largest `values`, largest first, without sorting the rest."""
+    if len(values) > n:
+        # argpartition is O(len); NaN sorts last, as in sort_values
+        candidates = np.argpartition(-values, n - 1)[:n]
+    else:
+        candidates = np.arange(len(values))
+    return candidates[np.argsort(-values[candidates], kind='stable')]
+
+
+def top_k(frame, n, metrics='Sales', by=None):
+    """The rows with the `n` largest values of each metric, per `by` index level when given.
+
+    Replaces `sort_values(metric, ascending=False).head(n)` (per group):
+    the groups' row positions are found once and shared by all metrics,
+    and only the `n` selected rows of each group are ever sorted.  A single
+    metric name returns a frame; a list of metrics returns {metric: frame}.
+    """
+    if by is None:
+        groups = [np.arange(len(frame))]
+    else:
+        groups = frame.groupby(level=by, observed=True).indices.values()
+
+    ranked = {}
+    for metric in [metrics] if isinstance(metrics, str) else metrics:
+        values = frame[metric].to_numpy(dtype=float)
+        positions = [group[_largest(values[group], n)] for group in groups] if n > 0 else []
+        ranked[metric] = frame.iloc[np.concatenate(positions) if positions else []]
+    return ranked[metrics] if isinstance(metrics, str) else ranked
+
+
+class RegionCube:
+    """Region x dimension aggregates, built once and sliced by every report section.
+
+    Each (Region, dimension) rollup is summed straight from the rows, so its
+    floating-point totals come out exactly as a per-region groupby of the
+    rows would give them; re-summing a finer grain would change the order
+    of the additions, and with it the last cent of some totals.  Distinct
+    counts cannot be rolled up, so the region totals (with their Order ID /
+    Customer ID counts) and the per-product order counts are kept alongside
+    the rollups.  A `base` frame at a finer grain (as the sketch engine
+    keeps) is rolled up to each of its dimensions instead.
+    """
+
+    def __init__(self, base, region_totals, product_orders, summary, precomputed=None):
+        dims = [] if base is None else [dim for dim in base.index.names if dim != 'Region']
+        self.rollups = {dim: base.groupby(level=['Region', dim], observed=True).sum() for dim in dims}
+        # Rollups summed from the rows, ranked sketch output of the approximate
+        # engine, or everything already grouped by the SQL backend's database
+        self.rollups.update(precomputed or {})
+        if product_orders is not None:
+            self.rollups['Product Name'] = self.rollups['Product Name'].join(product_orders)
+        self._region_totals = region_totals
+        self.summary = summary
+
+    @classmethod
+    def from_frame(cls, df):
+        # One groupby per dimension rather than one at the (Region, *DIMENSIONS)
+        # grain: only row-order sums reproduce the report's cents (a compensated
+        # sum prints East Machines' 66,106.165 as .16, not .17), and that grain
+        # is nearly as fine as the rows, so rolling it up is no cheaper
+        # (from_frame on 2M rows: 1.8 s per dimension vs 2.1 s from the base).
+        rollups = {dim: df.groupby(['Region', dim], observed=True)[METRICS].sum() for dim in DIMENSIONS}
+
+        region_totals = df.groupby('Region', observed=True).agg({
+            'Sales': 'sum',
+            'Quantity': 'sum',
+            'Order ID': 'nunique',
+            'Customer ID': 'nunique'
+        })
+        product_orders = df.groupby(['Region', 'Product Name'], observed=True)['Order ID'].nunique()
+        summary = {
+            'shape': df.shape,
+            'date_min': df['Order Date'].min(),
+            'date_max': df['Order Date'].max(),
+            'total_sales': df['Sales'].sum(),
+            'total_orders': df['Order ID'].nunique(),
+        }
+        return cls(None, region_totals, product_orders, summary, precomputed=rollups)
+
+    @classmethod
+    def from_chunks(cls, chunks):
+        """Build the cube from an iterable of row chunks without holding them all at once."""
+        accumulator = CubeAccumulator()
+        for chunk in chunks:
+            accumulator.add(chunk)
+        return accumulator.to_cube()
+
+    @property
+    def regions(self):
+        return self._region_totals.index.tolist()
+
+    def region_totals(self):
+        """Sales/Quantity sums and distinct order/customer counts per region."""
+        return self._region_totals.copy()
+
+    def breakdown(self, region, dim):
+        """All groups of `dim` inside one region, as the report's per-region groupby produced."""
+        return self.rollups[dim].xs(region, level='Region')
+
+    def region_slices(self, region):
+        """Every dimension's breakdown for one region, keyed by dimension."""
+        return {dim: self.breakdown(region, dim) for dim in self.rollups}
+
+    def top(self, dim, n=1, metric='Sales'):
+        """The `n` largest groups of `dim` in every region as a long Region/dim/metric frame."""
+        return self.rank(dim, n, [metric])[metric]
+
+    def rank(self, dim, n, metrics=METRICS):
+        """`top` for several metrics in one grouped pass, as {metric: long frame}."""
+        ranked = top_k(self.rollups[dim], n, list(metrics), by='Region')
+        return {metric: frame[[metric]].reset_index() for metric, frame in ranked.items()}
+
+    def top_pivot(self, dim, n, column=None):
+        """Region x dim table of the top-`n` groups per region, zero-filled elsewhere."""
+        long_df = self.top(dim, n)
+        if column is not None:
+            long_df = long_df.rename(columns={dim: column})
+        return long_df.pivot_table(index='Region', columns=column or dim, values='Sales', aggfunc='sum').fillna(0)
+
+
+class CubeAccumulator:
+    """Mergeable partial aggregates for building a RegionCube chunk by chunk.
+
+    Sums are kept per (Region, dimension), summed from each chunk's rows,
+    and distinct counts as exact sets of unique key rows, each as
+    PartialFrames, so memory grows with group cardinality rather than with
+    the number of rows read.  Two accumulators
+    fed disjoint chunks can be combined with `merge`.
+    """
+
+    # Unique key rows kept per distinct count: name -> (group keys, counted column)
+    DISTINCT = {
+        'region_orders': (['Region'], 'Order ID'),
+        'region_customers': (['Region'], 'Customer ID'),
+        'product_orders': (['Region', 'Product Name'], 'Order ID'),
+    }
+
+    def __init__(self):
+        self.rows = 0
+        self.columns = 0
+        self.date_min = None
+        self.date_max = None
+        self.rollups = {dim: PartialFrames(_sum_parts) for dim in DIMENSIONS}
+        self.region_sums = PartialFrames(_sum_parts)
+        self.distinct = {name: PartialFrames(_distinct_parts) for name in self.DISTINCT}
+
+    def add(self, chunk):
+        partial = CubeAccumulator()
+        partial.rows, partial.columns = chunk.shape
+        partial.date_min = chunk['Order Date'].min()
+        partial.date_max = chunk['Order Date'].max()
+        for dim in DIMENSIONS:
+            partial.rollups[dim].add(chunk.groupby(['Region', dim], observed=True, sort=False)[METRICS].sum())
+        partial.region_sums.add(chunk.groupby('Region', observed=True, sort=False)[['Sales', 'Quantity']].sum())
+        for name, (keys, column) in self.DISTINCT.items():
+            partial.distinct[name].add(chunk[keys + [column]].drop_duplicates(ignore_index=True))
+        return self.merge(partial)
+
+    def merge(self, other):
+        self.rows += other.rows
+        self.columns = max(self.columns, other.columns)
+        self.date_min = other.date_min if self.date_min is None else min(self.date_min, other.date_min)
+        self.date_max = other.date_max if self.date_max is None else max(self.date_max, other.date_max)
+        for dim in DIMENSIONS:
+            self.rollups[dim].merge(other.rollups[dim])
+        self.region_sums.merge(other.region_sums)
+        for name in self.DISTINCT:
+            self.distinct[name].merge(other.distinct[name])
+        return self
+
+    def _distinct_counts(self, name):
+        keys, column = self.DISTINCT[name]
+        return self.distinct[name].value().groupby(keys, observed=True)[column].size().rename(column)
+
+    def to_cube(self):
+        region_totals = self.region_sums.value().sort_index().join([
+            self._distinct_counts('region_orders'),
+            self._distinct_counts('region_customers'),
+        ])
+        summary = {
+            'shape': (self.rows, self.columns),
+            'date_min': self.date_min,
+            'date_max': self.date_max,
+            'total_sales': region_totals['Sales'].sum(),
+            'total_orders': self.distinct['region_orders'].value()['Order ID'].nunique(),
+        }
+        rollups = {dim: partial.value().sort_index() for dim, partial in self.rollups.items()}
+        return RegionCube(None, region_totals, self._distinct_counts('product_orders'), summary, precomputed=rollups)
@@ -0,0 +1,146 @@
+import hashlib
+import io
+import os
+import pickle
+
+import pandas as pd
+
+from store_cube import CubeAccumulator, merge_sums
+from store_latency import LatencyAccumulator
+from store_loader import ENCODING, read_options
+from store_rollups import daily_totals
+
+# Bumped whenever the stored state's layout changes; older state files are rebuilt
+STATE_VERSION = 3
+# Bytes just below the watermark that must be unchanged for the stored state to be reused
+TAIL_BYTES = 1 << 16
+
+
+def state_path(csv_path):
+    """`<stem>.ingest.pkl` next to the CSV: aggregates and high-water mark of its rows already folded in."""
+    stem, _ = os.path.splitext(csv_path)
+    return stem + '.ingest.pkl'
+
+
+class _ByteRange(io.RawIOBase):
+    """Read-only view of `file` from its current position up to byte `end`."""
+
+    def __init__(self, file, end):
+        self.file = file
+        self.end = end
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), max(self.end - self.file.tell(), 0))
+        data = self.file.read(size)
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def _tail_digest(file, offset):
+    # Digest of the TAIL_BYTES ending at `offset`, which covers the last consumed row
+    start = max(0, offset - TAIL_BYTES)
+    file.seek(start)
+    return hashlib.sha256(file.read(offset - start)).hexdigest()
+
+
+def _last_line_end(file, size, block=1 << 16):
+    """Offset just past the last newline, so a row still being appended is left for later."""
+    position = size
+    while position > 0:
+        start = max(0, position - block)
+        file.seek(start)
+        data = file.read(position - start)
+        newline = data.rfind(b'\n')
+        if newline >= 0:
+            return start + newline + 1
+        position = start
+    return 0
+
+
+class IncrementalIngest:
+    """Watermark-based ingestion for an append-only superstore CSV.
+
+    Each CSV has its own state file, keeping a CubeAccumulator, a
+    LatencyAccumulator and the daily trend totals of everything folded in
+    so far, the highest `Row ID` seen and the byte offset where the next
+    unread row starts, with a digest of the bytes just below it.  A run
+    seeks to that offset and parses only the appended rows; if the file
+    shrank, its header changed or the bytes below the offset no longer
+    match (the file was replaced or rewritten), the state is discarded and
+    the whole file is read again.
+    """
+
+    def __init__(self, csv_path, state_file=None):
+        self.csv_path = csv_path
+        self.state_path = state_file or state_path(csv_path)
+        self.state = None
+        # Set when the stored state was unusable and the whole file is being read
+        self.rebuilt = False
+        if os.path.exists(self.state_path):
+            with open(self.state_path, 'rb') as file:
+                self.state = pickle.load(file)
+
+    @property
+    def accumulator(self):
+        return self.state['accumulator']
+
+    @property
+    def latency(self):
+        return self.state['latency']
+
+    @property
+    def days(self):
+        return self.state['days']
+
+    @property
+    def watermark(self):
+        return self.state['row_id'] if self.state else None
+
+    def new_chunks(self, chunksize=100_000):
+        """Yield the parsed rows past the watermark and fold each chunk into the stored aggregates."""
+        size = os.path.getsize(self.csv_path)
+        with open(self.csv_path, 'rb') as file:
+            header = file.readline()
+            header_end = file.tell()
+            state = self.state
+            if (state is None or state.get('version') != STATE_VERSION or state['header'] != header
+                    or state['offset'] > size or state['tail'] != _tail_digest(file, state['offset'])):
+                state = {'version': STATE_VERSION, 'header': header, 'offset': header_end, 'row_id': 0,
+                         'accumulator': CubeAccumulator(), 'latency': LatencyAccumulator(),
+                         'days': None, 'tail': _tail_digest(file, header_end)}
+                self.rebuilt = True
+
+            end = _last_line_end(file, size)
+            if end <= state['offset']:
+                self.state = state
+                return
+
+            columns = pd.read_csv(io.BytesIO(header), encoding=ENCODING).columns
+            file.seek(state['offset'])
+            rows = io.TextIOWrapper(io.BufferedReader(_ByteRange(file, end)), encoding=ENCODING, newline='')
+            options = read_options(columns)
+            del options['encoding']
+            reader = pd.read_csv(rows, header=None, names=columns, chunksize=chunksize, **options)
+            for chunk in reader:
+                # Guard against rows re-written below the mark
+                chunk = chunk[chunk['Row ID'] > state['row_id']]
+                if chunk.empty:
+                    continue
+                state['accumulator'].add(chunk)
+                state['latency'].add(chunk)
+                state['days'] = merge_sums(state['days'], daily_totals(chunk))
+                state['row_id'] = max(state['row_id'], int(chunk['Row ID'].max()))
+                yield chunk
+            state['offset'] = end
+            state['tail'] = _tail_digest(file, end)
+        self.state = state
+
+    def commit(self):
+        """Persist the aggregates and the new high-water mark."""
+        temporary = self.state_path + '.tmp'
+        with open(temporary, 'wb') as file:
+            pickle.dump(self.state, file)
+        os.replace(temporary, self.state_path)
@@ -0,0 +1,78 @@
+import pandas as pd
+
+from store_sketches import KllSketch
+
+# Fulfilment latency is broken down along these, each on its own
+LATENCY_DIMENSIONS = ['Ship Mode', 'Region', 'State']
+QUANTILES = {'p50': 0.5, 'p90': 0.9, 'p99': 0.99}
+
+
+def days_to_ship(frame):
+    """Whole days from Order Date to Ship Date, computed on the columns at once."""
+    return (frame['Ship Date'] - frame['Order Date']).dt.days
+
+
+class LatencyAccumulator:
+    """Days-to-ship quantile sketches overall and per Ship Mode, Region and State.
+
+    Each order line adds its days to ship to one KLL sketch per group, so
+    chunks and worker processes can be folded in any order and merged
+    without ever sorting the full column.  Groups with fewer than k lines
+    (most states, in the sample data) get exact quantiles.
+    """
+
+    def __init__(self, k=200):
+        self.k = k
+        self.overall = KllSketch(k)
+        self.sketches = {dim: {} for dim in LATENCY_DIMENSIONS}
+
+    def _sketch(self, dim, key):
+        if key not in self.sketches[dim]:
+            self.sketches[dim][key] = KllSketch(self.k)
+        return self.sketches[dim][key]
+
+    def add(self, chunk):
+        """Fold in parsed rows, or rows carrying a precomputed 'Days to Ship' column.
+
+        Grouped input can also carry a 'Lines' column, the number of order
+        lines each row stands for; the sketches take it as a weight.
+        """
+        days = chunk['Days to Ship'] if 'Days to Ship' in chunk else days_to_ship(chunk)
+        shipped = days.notna().to_numpy()
+        chunk, days = chunk[shipped], days.to_numpy()[shipped].astype('int64')
+        lines = chunk['Lines'].to_numpy() if 'Lines' in chunk else None
+        self.overall.add(days, lines)
+        for dim in LATENCY_DIMENSIONS:
+            for key, positions in chunk.groupby(dim, observed=True, sort=False).indices.items():
+                self._sketch(dim, key).add(days[positions], None if lines is None else lines[positions])
+        return self
+
+    def merge(self, other):
+        self.overall.merge(other.overall)
+        for dim, sketches in other.sketches.items():
+            for key, sketch in sketches.items():
+                self._sketch(dim, key).merge(sketch)
+        return self
+
+    def tracking(self, chunks):
+        """Pass `chunks` through while folding each one in."""
+        for chunk in chunks:
+            self.add(chunk)
+            yield chunk
+
+    @staticmethod
+    def _row(sketch):
+        return [sketch.count, *sketch.quantiles(list(QUANTILES.values()))]
+
+    def tables(self):
+        """Lines and p50/p90/p99 days to ship, under 'All' and per dimension value."""
+        columns = ['Lines'] + list(QUANTILES)
+        tables = {'All': pd.DataFrame([self._row(self.overall)], columns=columns, index=pd.Index(['All'], name='Orders'))}
+        for dim, sketches in self.sketches.items():
+            keys = sorted(sketches)
+            tables[dim] = pd.DataFrame([self._row(sketches[key]) for key in keys], columns=columns,
+                                       index=pd.Index(keys, name=dim))
+        if not self.overall.count:
+            return tables
+        # Days to ship are whole numbers, and every quantile is one of them
+        return {dim: table.astype('int64') for dim, table in tables.items()}
@@ -0,0 +1,163 @@
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from store_archive import is_archive, iter_archive_chunks, read_archive
+
+# Superstore exports are Latin-1 encoded
+ENCODING = 'ISO-8859-1'
+DATE_COLUMNS = ['Order Date', 'Ship Date']
+DATE_FORMAT = '%m/%d/%Y'
+
+# Compact dtypes assigned while parsing.  Repeating labels become categoricals,
+# counts and ids shrink to 32 bits; Sales and Profit stay float64 so money
+# totals keep their cents.  Order ID is near-unique and stays a string.
+SCHEMA = {
+    'Row ID': 'int32',
+    'Ship Mode': 'category',
+    'Customer ID': 'category',
+    'Customer Name': 'category',
+    'Segment': 'category',
+    'Country': 'category',
+    'City': 'category',
+    'State': 'category',
+    'Postal Code': 'int32',
+    'Region': 'category',
+    'Product ID': 'category',
+    'Category': 'category',
+    'Sub-Category': 'category',
+    'Product Name': 'category',
+    'Sales': 'float64',
+    'Quantity': 'int32',
+    'Discount': 'float32',
+    'Profit': 'float64',
+}
+
+# Bumped whenever SCHEMA changes so existing Parquet sidecars are rebuilt
+SCHEMA_VERSION = 2
+
+
+def _sidecar_paths(csv_path):
+    stem, _ = os.path.splitext(csv_path)
+    return stem + '.parquet', stem + '.cache.json'
+
+
+def file_fingerprint(path, with_hash=True):
+    """Size, mtime, schema version and (optionally) SHA-256 of a file, used to detect a changed source."""
+    stat = os.stat(path)
+    fingerprint = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'schema': SCHEMA_VERSION}
+    if with_hash:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b''):
+                digest.update(block)
+        fingerprint['sha256'] = digest.hexdigest()
+    return fingerprint
+
+
+def _cache_is_fresh(csv_path, meta_path, verify_hash):
+    try:
+        with open(meta_path) as file:
+            cached = json.load(file)
+    except (OSError, ValueError):
+        return False
+
+    current = file_fingerprint(csv_path, with_hash=False)
+    if current['size'] != cached.get('size') or current['schema'] != cached.get('schema'):
+        return False
+    if current['mtime_ns'] == cached.get('mtime_ns') and not verify_hash:
+        return True
+
+    # mtime moved (or the caller asked for it): only a content change invalidates
+    current = file_fingerprint(csv_path)
+    if current['sha256'] != cached.get('sha256'):
+        return False
+    with open(meta_path, 'w') as file:
+        json.dump(current, file)
+    return True
+
+
+def fresh_sidecar(csv_path, verify_hash=False):
+    """Path of the Parquet sidecar when it is up to date with the CSV, else None."""
+    parquet_path, meta_path = _sidecar_paths(csv_path)
+    if os.path.exists(parquet_path) and _cache_is_fresh(csv_path, meta_path, verify_hash):
+        return parquet_path
+    return None
+
+
+def read_options(columns=None):
+    """read_csv keyword arguments that apply SCHEMA and parse the dates while reading."""
+    dtype = SCHEMA if columns is None else {column: SCHEMA[column] for column in columns if column in SCHEMA}
+    return {'encoding': ENCODING, 'dtype': dtype, 'parse_dates': DATE_COLUMNS, 'date_format': DATE_FORMAT}
+
+
+def _read_csv(csv_path, workers=1, **kwargs):
+    # Archives (.zip/.gz/.zst) are decompressed on the fly, never extracted to disk
+    if is_archive(csv_path):
+        return read_archive(csv_path, workers=workers, **kwargs)
+    return pd.read_csv(csv_path, **kwargs)
+
+
+def parse_superstore(csv_path, workers=1):
+    """Read the raw CSV (or every CSV member of an archive) into the compact schema with parsed dates."""
+    return _read_csv(csv_path, workers=workers, **read_options())
+
+
+def iter_superstore_chunks(csv_path, chunksize=100_000, workers=1):
+    """Stream the CSV in compactly typed row chunks, for the low-memory path.
+
+    `csv_path` may also be a zip, gzip or zstd archive; `workers` threads
+    then decompress the members of a multi-member zip in parallel.
+    """
+    if is_archive(csv_path):
+        yield from iter_archive_chunks(csv_path, chunksize, workers, **read_options())
+    else:
+        yield from pd.read_csv(csv_path, chunksize=chunksize, **read_options())
+
+
+def memory_report(csv_path, nrows=None):
+    """Per-column memory (MB) of the CSV read with default dtypes versus SCHEMA."""
+    before = _read_csv(csv_path, encoding=ENCODING, nrows=nrows)
+    after = _read_csv(csv_path, nrows=nrows, **read_options())
+    report = pd.DataFrame({
+        'dtype_before': before.dtypes.astype(str),
+        'MB_before': before.memory_usage(deep=True, index=False) / 2**20,
+        'dtype_after': after.dtypes.astype(str),
+        'MB_after': after.memory_usage(deep=True, index=False) / 2**20,
+    })
+    report.loc['Total'] = ['', report['MB_before'].sum(), '', report['MB_after'].sum()]
+    return report.round({'MB_before': 3, 'MB_after': 3})
+
+
+def load_superstore(csv_path, use_cache=True, verify_hash=False, workers=1):
+    """Load the superstore CSV through a typed Parquet sidecar next to it.
+
+    The first run parses the CSV and writes `<name>.parquet` plus a
+    `<name>.cache.json` fingerprint.  Later runs read the sidecar as long as
+    the source's size and mtime are unchanged; if only the mtime moved, the
+    content hash decides.  Pass `verify_hash=True` to always compare hashes.
+    An archive gets its sidecar next to it, fingerprinted like a plain CSV.
+    """
+    if not use_cache:
+        return parse_superstore(csv_path, workers)
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("pyarrow is not installed; reading the CSV without a columnar cache")
+        return parse_superstore(csv_path, workers)
+
+    cached = fresh_sidecar(csv_path, verify_hash)
+    if cached is not None:
+        return pd.read_parquet(cached)
+
+    parquet_path, meta_path = _sidecar_paths(csv_path)
+    # Fingerprint before parsing so a file rewritten mid-read is not marked fresh
+    fingerprint = file_fingerprint(csv_path)
+    df = parse_superstore(csv_path, workers)
+    df.to_parquet(parquet_path, index=False)
+    with open(meta_path, 'w') as file:
+        json.dump(fingerprint, file)
+    return df
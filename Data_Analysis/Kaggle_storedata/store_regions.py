@@ -0,0 +1,104 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from store_cube import top_k
+
+# Shared helpers of the Data_Analysis projects live one level up
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from analysis_report import Report  # noqa: E402
+
+
+def region_section(region, totals, breakdowns, total_sales, approx=False):
+    """One region's section of the DETAILED REGIONAL ANALYSIS report.
+
+    Works only on the region's own pre-sliced breakdowns (`totals` from the
+    region_sales table, `breakdowns` mapping dimension -> region slice of the
+    cube), so it can run in a worker process without the full frame.
+    """
+    report = Report(region).section(region, banner=f"\n{'='*60}\nREGION: {region.upper()}\n{'='*60}")
+
+    # Sales statistics for this region
+    region_total_sales = totals['Sales']
+    region_orders = totals['Order ID']
+    region_customers = totals['Customer ID']
+
+    report.text("Region Overview:")
+    report.value('total_sales', region_total_sales, f"   - Total Sales: ${region_total_sales:,.2f}")
+    report.value('total_orders', region_orders, f"   - Total Orders: {region_orders:,}")
+    report.value('total_customers', region_customers, f"   - Total Customers: {region_customers:,}")
+    report.value('avg_order_value', region_total_sales/region_orders,
+                 f"   - Avg Order Value: ${region_total_sales/region_orders:.2f}")
+    report.value('sales_share', region_total_sales/total_sales,
+                 f"   - % of Total Sales: {region_total_sales/total_sales*100:.1f}%")
+
+    # Top categories in this region
+    report.text("\nTop Categories:")
+    region_categories = breakdowns['Category'][['Sales', 'Quantity']].round(2).sort_values('Sales', ascending=False)
+    report.table('top_categories', region_categories, '\n'.join(
+        f"   {idx}. {category}: ${data['Sales']:,.2f} ({data['Sales']/region_total_sales*100:.1f}% of region sales)"
+        for idx, (category, data) in enumerate(region_categories.iterrows(), 1)))
+
+    # Top sub-categories in this region
+    report.text("\nTop Sub-Categories:")
+    region_subcats = top_k(breakdowns['Sub-Category'][['Sales', 'Quantity']].round(2), 5)
+    report.table('top_subcategories', region_subcats, '\n'.join(
+        f"   {idx}. {subcat}: ${data['Sales']:,.2f} ({data['Sales']/region_total_sales*100:.1f}% of region sales)"
+        for idx, (subcat, data) in enumerate(region_subcats.iterrows(), 1)))
+
+    # Top products in this region
+    report.text("\nTop Products:")
+    if approx:
+        region_products = top_k(breakdowns['Product Name'][['Sales', 'Error']].round(2), 5)
+        product_lines = [f"   {idx}. {product}: ~${data['Sales']:,.2f} (±${data['Error']:,.2f})"
+                         for idx, (product, data) in enumerate(region_products.iterrows(), 1)]
+    else:
+        region_products = top_k(breakdowns['Product Name'][['Sales', 'Quantity', 'Order ID']].round(2), 5)
+        product_lines = [f"   {idx}. {product}: ${data['Sales']:,.2f} ({data['Quantity']:.0f} units, {data['Order ID']} orders)"
+                         for idx, (product, data) in enumerate(region_products.iterrows(), 1)]
+    report.table('top_products', region_products, '\n'.join(product_lines))
+
+    # Top states in this region
+    report.text("\nTop States:")
+    region_states = top_k(breakdowns['State'].round(2), 3)
+    if approx:
+        state_lines = [f"   {idx}. {state}: ~${data['Sales']:,.2f} (±${data['Error']:,.2f})"
+                       for idx, (state, data) in enumerate(region_states.iterrows(), 1)]
+    else:
+        state_lines = [f"   {idx}. {state}: ${data['Sales']:,.2f}"
+                       for idx, (state, data) in enumerate(region_states.iterrows(), 1)]
+    report.table('top_states', region_states, '\n'.join(state_lines))
+
+    # Customer segments in this region
+    report.text("\nCustomer Segments:")
+    region_segments = breakdowns['Segment'][['Sales']].round(2).sort_values('Sales', ascending=False)
+    report.table('segments', region_segments, '\n'.join(
+        f"   - {segment}: ${data['Sales']:,.2f} ({data['Sales']/region_total_sales*100:.1f}% of region sales)"
+        for segment, data in region_segments.iterrows()))
+
+    return report.sections[0]
+
+
+def _region_section_task(task):
+    return region_section(*task)
+
+
+def region_sections(cube, region_totals, regions, total_sales, approx=False, workers=1):
+    """Per-region report sections in `regions` order, fanned out to `workers` processes.
+
+    Each task carries only that region's slices of the cube, never the rows.
+    """
+    tasks = [
+        (region,
+         {column: region_totals.at[region, column] for column in ('Sales', 'Order ID', 'Customer ID')},
+         cube.region_slices(region),
+         total_sales,
+         approx)
+        for region in regions
+    ]
+    if workers <= 1:
+        return [region_section(*task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map yields results in submission order, keeping the report deterministic
+        return list(pool.map(_region_section_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
@@ -0,0 +1,152 @@
+import json
+import os
+
+import pandas as pd
+
+from store_cube import merge_sums
+
+KEYS = ['Region', 'Category']
+MEASURES = ['Sales', 'Profit', 'Quantity']
+
+# Each level is derived from the one before it
+LEVELS = [('daily', 'D'), ('monthly', 'M'), ('quarterly', 'Q'), ('yearly', 'Y')]
+
+
+def rollup_dir(source):
+    """`<stem>.rollups` next to the source, so each dataset keeps its own store."""
+    stem, _ = os.path.splitext(source)
+    return stem + '.rollups'
+
+
+def daily_totals(frame):
+    """Sales/Profit/Quantity per (order day, Region, Category) for a block of parsed rows."""
+    days = frame['Order Date'].dt.normalize().rename('Period')
+    return frame.groupby([days] + KEYS, observed=True, sort=False)[MEASURES].sum()
+
+
+class RollupStore:
+    """Persistent daily -> monthly -> quarterly -> yearly rollups per Region and Category.
+
+    Each level is a pickled frame indexed by (Period, Region, Category),
+    where Period is the first day of the day/month/quarter/year.  Updating
+    a set of days rewrites only those days and the periods that contain
+    them, so trend queries never touch the raw order rows.
+
+    The store is kept per source and records the fingerprint of the data
+    it reflects.  Rows are not assumed to arrive in date order, and stored
+    rows may be corrected, so when the fingerprint changes the daily totals
+    of the whole dataset (a few thousand rows, usually answered from the
+    result cache) are compared with the stored daily level, and only the
+    days that were added, changed or emptied are folded in.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.levels = {}
+        for name, _ in LEVELS:
+            path = self._path(name)
+            self.levels[name] = pd.read_pickle(path) if os.path.exists(path) else None
+        try:
+            with open(self._path('source', '.json')) as file:
+                self.fingerprint = json.load(file)['fingerprint']
+        except (OSError, ValueError, KeyError):
+            self.fingerprint = None
+        self._pending = None
+
+    @classmethod
+    def for_source(cls, source):
+        return cls(rollup_dir(source))
+
+    def _path(self, name, suffix='.pkl'):
+        return os.path.join(self.directory, name + suffix)
+
+    def tracking(self, chunks):
+        """Pass `chunks` through while collecting the daily totals of all their rows for `commit`."""
+        for chunk in chunks:
+            self._pending = merge_sums(self._pending, daily_totals(chunk))
+            yield chunk
+
+    def commit(self, fingerprint):
+        """Sync the store to the daily totals collected by `tracking`."""
+        if self._pending is not None:
+            self.sync(self._pending, fingerprint)
+            self._pending = None
+
+    def _changed_days(self, days):
+        # Days whose stored totals differ from `days`, including days that
+        # gained or lost a (Region, Category) row or vanished altogether
+        stored = self.levels['daily']
+        if stored is None:
+            return days.index.get_level_values('Period').unique()
+        index = stored.index.union(days.index)
+        old, new = stored.reindex(index), days.reindex(index)
+        same = ((old == new) | (old.isna() & new.isna())).all(axis=1)
+        return index[~same.to_numpy()].get_level_values('Period').unique()
+
+    def sync(self, days, fingerprint):
+        """Make the store reflect `days`, the daily totals of the whole dataset with `fingerprint`.
+
+        Nothing is done while the fingerprint is the one stored; otherwise
+        the days that differ from the stored daily level are updated and
+        the fingerprint saved with them.  `days` is None for a dataset with
+        no rows yet.
+        """
+        if fingerprint is not None and fingerprint == self.fingerprint:
+            return self
+        if days is None and self.levels['daily'] is not None:
+            days = self.levels['daily'].iloc[:0]
+        if days is not None:
+            changed = self._changed_days(days)
+            self.update(days[days.index.get_level_values('Period').isin(changed)], changed)
+        self.fingerprint = fingerprint
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path('source', '.json'), 'w') as file:
+            json.dump({'fingerprint': fingerprint}, file)
+        return self
+
+    def update(self, days, periods=None):
+        """Replace the stored totals of the days in `periods` with `days` and save.
+
+        `days` are daily totals (as from `daily_totals`); `periods` defaults
+        to the days they cover, and a day listed there but absent from
+        `days` is removed.  Every month, quarter and year containing one of
+        those days is recomputed from the level below it.
+        """
+        touched = pd.DatetimeIndex(days.index.get_level_values('Period').unique() if periods is None else periods)
+        if touched.empty:
+            return self
+
+        child = None
+        for name, freq in LEVELS:
+            stored = self.levels[name]
+            touched_periods = touched.to_period(freq).unique()
+            if child is None:
+                fresh = days
+            else:
+                # Recompute the touched parent periods from the (already updated) child level
+                child_periods = child.index.get_level_values('Period')
+                subset = child[child_periods.to_period(freq).isin(touched_periods)]
+                starts = subset.index.get_level_values('Period').to_period(freq).start_time.rename('Period')
+                fresh = subset.groupby([starts] + [subset.index.get_level_values(key) for key in KEYS], observed=True).sum()
+
+            if stored is not None:
+                kept = stored[~stored.index.get_level_values('Period').to_period(freq).isin(touched_periods)]
+                fresh = pd.concat([kept, fresh])
+            self.levels[name] = child = fresh.sort_index()
+
+        os.makedirs(self.directory, exist_ok=True)
+        for name, frame in self.levels.items():
+            frame.to_pickle(self._path(name))
+        return self
+
+    def trend(self, level='monthly', by=None, region=None, category=None):
+        """Measures per period at `level`, optionally filtered and split by 'Region'/'Category'."""
+        frame = self.levels[level]
+        if frame is None:
+            return pd.DataFrame(columns=MEASURES, index=pd.DatetimeIndex([], name='Period'))
+        if region is not None:
+            frame = frame.xs(region, level='Region', drop_level=False)
+        if category is not None:
+            frame = frame.xs(category, level='Category', drop_level=False)
+        keys = ['Period'] + ([by] if by else [])
+        return frame.groupby(level=keys, observed=True).sum()
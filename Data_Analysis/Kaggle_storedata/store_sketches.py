@@ -0,0 +1,366 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from store_cube import RegionCube, merge_sums
+
+
+def hash_values(values, hash_key='0123456789123456'):
+    """Vectorized 64-bit hashes of a column of values (hash_key must be 16 characters)."""
+    return pd.util.hash_pandas_object(pd.Series(values), index=False, hash_key=hash_key).to_numpy()
+
+
+def remix(hashes, salt):
+    """Hashes re-mixed with `salt` (splitmix64 finalizer), one independent family per salt.
+
+    hash_pandas_object ignores its hash_key for numeric values, so
+    independent hash rows are derived from one base hash instead.
+    """
+    mixed = hashes + np.uint64(salt * 0x9E3779B97F4A7C15 % (1 << 64))
+    mixed = (mixed ^ (mixed >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    mixed = (mixed ^ (mixed >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return mixed ^ (mixed >> np.uint64(31))
+
+
+class HyperLogLog:
+    """Distinct-count sketch with 2**p one-byte registers.
+
+    The estimate's standard error is about 1.04 / sqrt(2**p) (0.8% at the
+    default p=14).  Sketches built with the same precision merge by taking
+    the register-wise maximum.
+    """
+
+    def __init__(self, p=14):
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+
+    @property
+    def relative_error(self):
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def _positions(self, hashes):
+        index = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        remainder = hashes & np.uint64((1 << (64 - self.p)) - 1)
+        # frexp gives the exact bit length of values below 2**53
+        _, bit_length = np.frexp(remainder.astype(np.float64))
+        rank = (64 - self.p) - bit_length + 1
+        return index, rank.astype(np.uint8)
+
+    def add_hashes(self, hashes):
+        index, rank = self._positions(hashes)
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def add(self, values):
+        return self.add_hashes(hash_values(values))
+
+    def merge(self, other):
+        if other.p != self.p:
+            raise ValueError(f"cannot merge HyperLogLog sketches of precision {self.p} and {other.p}")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate while many registers are still empty
+            estimate = m * math.log(m / zeros)
+        return estimate
+
+
+class SpaceSaving:
+    """Weighted heavy-hitter summary keeping at most `capacity` counters.
+
+    Every estimate over-counts the true weight by at most its `error`, and
+    any item not kept has a true weight of at most `floor`; both stay below
+    total weight / capacity.  Summaries merge by adding counters, charging
+    an item missing from one side that side's floor.
+    """
+
+    def __init__(self, capacity=100):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype='float64')
+        self.errors = pd.Series(dtype='float64')
+        self.floor = 0.0
+
+    def _truncate(self, counts, errors, floor):
+        if len(counts) > self.capacity:
+            keep = counts.nlargest(self.capacity).index
+            dropped = counts.drop(keep)
+            floor = max(floor, dropped.max())
+            counts, errors = counts.loc[keep], errors.loc[keep]
+        self.counts, self.errors, self.floor = counts, errors, floor
+
+    def add(self, items, weights):
+        exact = pd.Series(np.asarray(weights, dtype='float64')).groupby(np.asarray(items)).sum()
+        chunk = SpaceSaving(self.capacity)
+        chunk._truncate(exact, pd.Series(0.0, index=exact.index), 0.0)
+        return self.merge(chunk)
+
+    def merge(self, other):
+        items = self.counts.index.union(other.counts.index)
+        counts = (self.counts.reindex(items, fill_value=self.floor)
+                  + other.counts.reindex(items, fill_value=other.floor))
+        errors = (self.errors.reindex(items, fill_value=self.floor)
+                  + other.errors.reindex(items, fill_value=other.floor))
+        self._truncate(counts, errors, self.floor + other.floor)
+        return self
+
+    def top(self, n=None):
+        """The `n` (default: all kept) heaviest items with estimated weight and maximum over-count."""
+        keep = self.counts.nlargest(n or len(self.counts)).index
+        return pd.DataFrame({'Estimate': self.counts.loc[keep], 'Error': self.errors.loc[keep]})
+
+
+class CountMinTopK:
+    """Count-Min sketch with a candidate list of the `k` heaviest keys.
+
+    With width ceil(e / eps) and depth ceil(ln(1 / delta)), each estimate
+    over-counts by at most eps * total weight with probability 1 - delta.
+    Sketches with the same shape merge by adding their tables.
+    """
+
+    def __init__(self, k=20, eps=0.001, delta=0.01):
+        self.k = k
+        self.eps = eps
+        self.width = math.ceil(math.e / eps)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.table = np.zeros((self.depth, self.width))
+        self.total = 0.0
+        self.candidates = pd.Index([])
+
+    @property
+    def error_bound(self):
+        return self.eps * self.total
+
+    def _columns(self, items):
+        hashes = hash_values(items)
+        return [(remix(hashes, row + 1) % np.uint64(self.width)).astype(np.int64) for row in range(self.depth)]
+
+    def estimate(self, items):
+        columns = self._columns(items)
+        rows = [self.table[row, column] for row, column in enumerate(columns)]
+        return pd.Series(np.min(rows, axis=0), index=items)
+
+    def _refresh_candidates(self, items):
+        items = self.candidates.union(pd.Index(items))
+        if len(items):
+            self.candidates = self.estimate(items).nlargest(self.k).index
+
+    def add(self, items, weights):
+        exact = pd.Series(np.asarray(weights, dtype='float64')).groupby(np.asarray(items)).sum()
+        for row, column in enumerate(self._columns(exact.index)):
+            np.add.at(self.table[row], column, exact.to_numpy())
+        self.total += exact.sum()
+        self._refresh_candidates(exact.index)
+        return self
+
+    def merge(self, other):
+        if other.table.shape != self.table.shape:
+            raise ValueError("cannot merge Count-Min sketches of different shapes")
+        self.table += other.table
+        self.total += other.total
+        self._refresh_candidates(other.candidates)
+        return self
+
+    def top(self, n=None):
+        """The `n` (default: all `k`) heaviest candidates with estimated weight and the error bound."""
+        estimates = self.estimate(self.candidates).nlargest(n or self.k)
+        return pd.DataFrame({'Estimate': estimates, 'Error': self.error_bound})
+
+
+class KllSketch:
+    """Mergeable quantile sketch (KLL) of a numeric stream.
+
+    Values live in compactor levels, where a value on level h stands for
+    2**h inputs.  A full level is sorted and every other value (random
+    offset) is promoted, so about 3k values are kept in all and quantile
+    ranks stay within roughly 1.7% at the default k=200.  Groups smaller
+    than k are exact.  Sketches with the same k merge level by level.
+    """
+
+    def __init__(self, k=200, seed=0):
+        self.k = k
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        # Higher levels get geometrically more room, the top one k values
+        depth = len(self.levels) - level - 1
+        return max(8, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            values = self.levels[level]
+            if len(values) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=values.dtype))
+                values = np.sort(values)
+                # An odd value out stays behind so the total weight is unchanged
+                odd = len(values) % 2
+                self.levels[level] = values[:odd]
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], values[odd + self._rng.integers(2)::2]])
+            level += 1
+
+    def add(self, values, weights=None):
+        """Fold in `values`; with `weights`, each value stands for that many (whole) inputs."""
+        values = np.asarray(values)
+        if self.count == 0:
+            self.levels[0] = self.levels[0].astype(values.dtype)
+        if weights is not None:
+            return self._add_weighted(values, np.asarray(weights, dtype=np.int64))
+        # Fed k at a time, so the lower levels refill between compactions
+        for start in range(0, len(values), self.k):
+            self.levels[0] = np.concatenate([self.levels[0], values[start:start + self.k]])
+            self._compress()
+        self.count += len(values)
+        return self
+
+    def _add_weighted(self, values, weights):
+        # A value on level h stands for 2**h inputs, so a weight's binary digits
+        # say which levels the value goes on; counts are never expanded to rows
+        for level in range(int(weights.max()).bit_length() if len(weights) else 0):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0, dtype=self.levels[0].dtype))
+            self.levels[level] = np.concatenate([self.levels[level], values[(weights >> level) & 1 == 1]])
+        self.count += int(weights.sum())
+        self._compress()
+        return self
+
+    def merge(self, other):
+        if other.k != self.k:
+            raise ValueError(f"cannot merge KLL sketches with k={self.k} and k={other.k}")
+        if self.count == 0:
+            self.levels[0] = self.levels[0].astype(other.levels[0].dtype)
+        for level, values in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(values)
+            else:
+                self.levels[level] = np.concatenate([self.levels[level], values])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantiles(self, qs):
+        """Smallest kept value whose weighted rank reaches each q (inverted CDF, as `np.quantile`)."""
+        if not self.count:
+            return np.full(len(qs), np.nan)
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(kept), 1 << level) for level, kept in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        ranks = np.cumsum(weights[order])
+        positions = np.searchsorted(ranks, np.asarray(qs) * self.count, side='left')
+        return values[order][np.minimum(positions, len(values) - 1)]
+
+
+class SketchAccumulator:
+    """Approximate counterpart of CubeAccumulator for very large exports.
+
+    Low-cardinality breakdowns (Category, Sub-Category, Segment) stay exact;
+    Order ID / Customer ID distinct counts use HyperLogLog, product ranking
+    uses Space-Saving and state ranking uses Count-Min, one sketch per
+    region.  Accumulators merge across chunks and across worker processes.
+    """
+
+    EXACT_DIMENSIONS = ['Category', 'Sub-Category', 'Segment']
+
+    def __init__(self, hll_precision=14, product_capacity=200, state_k=20):
+        self.hll_precision = hll_precision
+        self.product_capacity = product_capacity
+        self.state_k = state_k
+        self.rows = 0
+        self.columns = 0
+        self.date_min = None
+        self.date_max = None
+        self.base = None
+        self.region_sums = None
+        self.all_orders = HyperLogLog(hll_precision)
+        self.orders = {}
+        self.customers = {}
+        self.products = {}
+        self.states = {}
+
+    def _region_sketches(self, region):
+        if region not in self.orders:
+            self.orders[region] = HyperLogLog(self.hll_precision)
+            self.customers[region] = HyperLogLog(self.hll_precision)
+            self.products[region] = SpaceSaving(self.product_capacity)
+            self.states[region] = CountMinTopK(self.state_k)
+
+    def _add_distinct(self, sketches, regions, values):
+        hashes = hash_values(values)
+        for region, positions in pd.Series(np.arange(len(hashes))).groupby(regions, observed=True):
+            sketches[region].add_hashes(hashes[positions.to_numpy()])
+        return hashes
+
+    def add(self, chunk):
+        self.rows += len(chunk)
+        self.columns = max(self.columns, chunk.shape[1])
+        chunk_min, chunk_max = chunk['Order Date'].min(), chunk['Order Date'].max()
+        self.date_min = chunk_min if self.date_min is None else min(self.date_min, chunk_min)
+        self.date_max = chunk_max if self.date_max is None else max(self.date_max, chunk_max)
+
+        base = chunk.groupby(['Region'] + self.EXACT_DIMENSIONS, observed=True, sort=False)[['Sales', 'Quantity', 'Profit']].sum()
+        region_sums = chunk.groupby('Region', observed=True, sort=False)[['Sales', 'Quantity']].sum()
+        self.base = merge_sums(self.base, base)
+        self.region_sums = merge_sums(self.region_sums, region_sums)
+
+        regions = chunk['Region'].to_numpy()
+        for region in pd.unique(regions):
+            self._region_sketches(region)
+        self.all_orders.add_hashes(self._add_distinct(self.orders, regions, chunk['Order ID']))
+        self._add_distinct(self.customers, regions, chunk['Customer ID'])
+
+        for dim, sketches in (('Product Name', self.products), ('State', self.states)):
+            sales = chunk.groupby(['Region', dim], observed=True, sort=False)['Sales'].sum()
+            for region, group in sales.groupby(level='Region', observed=True, sort=False):
+                sketches[region].add(group.index.get_level_values(dim), group.to_numpy())
+        return self
+
+    def merge(self, other):
+        self.rows += other.rows
+        self.columns = max(self.columns, other.columns)
+        for attr, pick in (('date_min', min), ('date_max', max)):
+            mine, theirs = getattr(self, attr), getattr(other, attr)
+            setattr(self, attr, theirs if mine is None else mine if theirs is None else pick(mine, theirs))
+        self.base = merge_sums(self.base, other.base)
+        self.region_sums = merge_sums(self.region_sums, other.region_sums)
+        self.all_orders.merge(other.all_orders)
+        for region in other.orders:
+            if region not in self.orders:
+                self._region_sketches(region)
+            self.orders[region].merge(other.orders[region])
+            self.customers[region].merge(other.customers[region])
+            self.products[region].merge(other.products[region])
+            self.states[region].merge(other.states[region])
+        return self
+
+    def _ranking(self, sketches):
+        frames = {region: sketch.top() for region, sketch in sketches.items()}
+        ranking = pd.concat(frames, names=['Region'])
+        return ranking.rename(columns={'Estimate': 'Sales'})
+
+    def to_cube(self):
+        region_totals = self.region_sums.sort_index()
+        region_totals['Order ID'] = [round(self.orders[region].count()) for region in region_totals.index]
+        region_totals['Customer ID'] = [round(self.customers[region].count()) for region in region_totals.index]
+        summary = {
+            'shape': (self.rows, self.columns),
+            'date_min': self.date_min,
+            'date_max': self.date_max,
+            'total_sales': region_totals['Sales'].sum(),
+            'total_orders': round(self.all_orders.count()),
+            'distinct_error': HyperLogLog(self.hll_precision).relative_error,
+        }
+        sketched = {
+            'Product Name': self._ranking(self.products).rename_axis(['Region', 'Product Name']),
+            'State': self._ranking(self.states).rename_axis(['Region', 'State']),
+        }
+        return RegionCube(self.base, region_totals, None, summary, precomputed=sketched)
+
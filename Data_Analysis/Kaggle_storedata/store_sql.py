@@ -0,0 +1,165 @@
+import json
+import os
+import sqlite3
+
+import pandas as pd
+
+from store_cube import DIMENSIONS, METRICS, RegionCube
+from store_latency import LATENCY_DIMENSIONS
+from store_loader import DATE_COLUMNS, file_fingerprint, fresh_sidecar, iter_superstore_chunks
+from store_rollups import KEYS, MEASURES
+
+SQL_ENGINES = ['duckdb', 'sqlite']
+TABLE = 'superstore'
+META_TABLE = 'superstore_source'
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _literal(text):
+    return "'" + text.replace("'", "''") + "'"
+
+
+def _sums(columns):
+    # Pin the result types: DuckDB would otherwise return integer sums as HUGEINT
+    return ', '.join(f"CAST(SUM({_quote(c)}) AS {'BIGINT' if c == 'Quantity' else 'DOUBLE'}) AS {_quote(c)}"
+                     for c in columns)
+
+
+class SqlBackend:
+    """Runs the regional report's aggregations inside DuckDB or SQLite.
+
+    Only grouped results come back to pandas, so memory follows group
+    cardinality rather than the size of the data.  DuckDB queries the
+    Parquet sidecar in place when it is fresh; otherwise, and always for
+    SQLite, the CSV is copied chunk by chunk into an on-disk database next
+    to it (`<name>.duckdb` / `<name>.sqlite`) that is reused until the
+    source's size or mtime changes.
+    """
+
+    def __init__(self, csv_path, engine='duckdb', chunksize=100_000):
+        if engine not in SQL_ENGINES:
+            raise ValueError(f"engine must be one of {SQL_ENGINES}, not {engine!r}")
+        self.engine = engine
+        self.csv_path = csv_path
+        self.chunksize = chunksize
+        if engine == 'duckdb':
+            import duckdb
+            parquet_path = fresh_sidecar(csv_path)
+            if parquet_path is not None:
+                self.con = duckdb.connect()
+                self.source = f"read_parquet({_literal(parquet_path)})"
+                return
+            self.con = duckdb.connect(self._database_path())
+        else:
+            self.con = sqlite3.connect(self._database_path())
+        self.source = TABLE
+        self._refresh_table()
+
+    def _database_path(self):
+        stem, _ = os.path.splitext(self.csv_path)
+        return f'{stem}.{self.engine}'
+
+    def query(self, sql, params=()):
+        if self.engine == 'duckdb':
+            return self.con.execute(sql, list(params)).df()
+        return pd.read_sql_query(sql, self.con, params=params)
+
+    def _refresh_table(self):
+        """(Re)load the CSV into the database table unless it already holds this version of the file."""
+        fingerprint = json.dumps(file_fingerprint(self.csv_path, with_hash=False), sort_keys=True)
+        self.con.execute(f"CREATE TABLE IF NOT EXISTS {META_TABLE} (fingerprint TEXT)")
+        stored = self.con.execute(f"SELECT fingerprint FROM {META_TABLE}").fetchall()
+        if stored == [(fingerprint,)]:
+            return
+
+        self.con.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        for index, chunk in enumerate(iter_superstore_chunks(self.csv_path, self.chunksize)):
+            # Database columns are plain text; categories are a pandas-side representation
+            chunk = chunk.astype({column: str for column, dtype in chunk.dtypes.items() if dtype == 'category'})
+            if self.engine == 'duckdb':
+                statement = 'CREATE TABLE {} AS SELECT * FROM chunk' if index == 0 else 'INSERT INTO {} SELECT * FROM chunk'
+                self.con.execute(statement.format(TABLE))
+            else:
+                for column in DATE_COLUMNS:
+                    chunk[column] = chunk[column].dt.strftime('%Y-%m-%d')
+                chunk.to_sql(TABLE, self.con, if_exists='append', index=False)
+        self.con.execute(f"DELETE FROM {META_TABLE}")
+        self.con.execute(f"INSERT INTO {META_TABLE} VALUES (?)", [fingerprint])
+        self.con.commit()
+
+    def _rollups(self):
+        """(Region, dim) sums for every dimension, plus distinct orders per product."""
+        rollups = {}
+        if self.engine == 'duckdb':
+            # One scan computes every rollup; GROUPING() tells the sets apart
+            groups = ', '.join(f"({_quote('Region')}, {_quote(dim)})" for dim in DIMENSIONS)
+            flags = ', '.join(f"GROUPING({_quote(dim)}) AS {_quote('grouped ' + dim)}" for dim in DIMENSIONS)
+            frame = self.query(
+                f"SELECT Region, {', '.join(_quote(dim) for dim in DIMENSIONS)}, {_sums(METRICS)}, "
+                f"COUNT(DISTINCT {_quote('Order ID')}) AS {_quote('Order ID')}, {flags} "
+                f"FROM {self.source} GROUP BY GROUPING SETS ({groups})")
+            for dim in DIMENSIONS:
+                rows = frame[frame['grouped ' + dim] == 0]
+                rollups[dim] = rows.set_index(['Region', dim])[METRICS + ['Order ID']]
+        else:
+            for dim in DIMENSIONS:
+                rollups[dim] = self.query(
+                    f"SELECT Region, {_quote(dim)}, {_sums(METRICS)}, "
+                    f"COUNT(DISTINCT {_quote('Order ID')}) AS {_quote('Order ID')} "
+                    f"FROM {self.source} GROUP BY Region, {_quote(dim)}").set_index(['Region', dim])
+
+        for dim, frame in rollups.items():
+            # Distinct orders are only reported per product
+            columns = METRICS + ['Order ID'] if dim == 'Product Name' else METRICS
+            rollups[dim] = frame[columns].sort_index()
+        return rollups
+
+    def cube(self):
+        """A RegionCube whose aggregates were all computed by the database."""
+        region_totals = self.query(
+            f"SELECT Region, {_sums(['Sales', 'Quantity'])}, "
+            f"COUNT(DISTINCT {_quote('Order ID')}) AS {_quote('Order ID')}, "
+            f"COUNT(DISTINCT {_quote('Customer ID')}) AS {_quote('Customer ID')} "
+            f"FROM {self.source} GROUP BY Region ORDER BY Region").set_index('Region')
+
+        overall = self.query(
+            f"SELECT COUNT(*) AS rows, MIN({_quote('Order Date')}) AS date_min, "
+            f"MAX({_quote('Order Date')}) AS date_max, SUM(Sales) AS total_sales, "
+            f"COUNT(DISTINCT {_quote('Order ID')}) AS total_orders FROM {self.source}").iloc[0]
+        columns = len(self.query(f"SELECT * FROM {self.source} LIMIT 0").columns)
+        summary = {
+            'shape': (int(overall['rows']), columns),
+            'date_min': pd.Timestamp(overall['date_min']),
+            'date_max': pd.Timestamp(overall['date_max']),
+            'total_sales': float(overall['total_sales']),
+            'total_orders': int(overall['total_orders']),
+        }
+        return RegionCube(None, region_totals, None, summary, precomputed=self._rollups())
+
+    def daily_totals(self):
+        """Per (order day, Region, Category) measures as `store_rollups.daily_totals` returns them."""
+        keys = ', '.join(_quote(key) for key in KEYS)
+        days = self.query(
+            f"SELECT {_quote('Order Date')} AS Period, {keys}, {_sums(MEASURES)} "
+            f"FROM {self.source} GROUP BY {_quote('Order Date')}, {keys}")
+        days['Period'] = pd.to_datetime(days['Period'])
+        return days.set_index(['Period'] + KEYS)
+
+    def shipping_days(self):
+        """Ship Mode, Region, State and 'Days to Ship' with the number of order 'Lines' of each.
+
+        The database groups lines by (dimensions, days) and only those counts
+        are transferred; the quantile sketches take them as weights, so the
+        lines are never expanded into pandas.
+        """
+        if self.engine == 'duckdb':
+            days = f"date_diff('day', {_quote('Order Date')}, {_quote('Ship Date')})"
+        else:
+            days = f"CAST(julianday({_quote('Ship Date')}) - julianday({_quote('Order Date')}) AS INTEGER)"
+        dims = ', '.join(_quote(dim) for dim in LATENCY_DIMENSIONS)
+        return self.query(
+            f"SELECT {dims}, {days} AS {_quote('Days to Ship')}, COUNT(*) AS Lines "
+            f"FROM {self.source} GROUP BY {dims}, {_quote('Days to Ship')}")
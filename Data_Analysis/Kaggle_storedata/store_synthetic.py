@@ -0,0 +1,220 @@
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from store_loader import ENCODING
+
+REGION_STATES = {
+    'Central': ['Illinois', 'Indiana', 'Iowa', 'Kansas', 'Michigan', 'Minnesota', 'Missouri', 'Nebraska',
+                'North Dakota', 'Oklahoma', 'South Dakota', 'Texas', 'Wisconsin'],
+    'East': ['Connecticut', 'Delaware', 'District of Columbia', 'Maine', 'Maryland', 'Massachusetts',
+             'New Hampshire', 'New Jersey', 'New York', 'Ohio', 'Pennsylvania', 'Rhode Island', 'Vermont',
+             'West Virginia'],
+    'South': ['Alabama', 'Arkansas', 'Florida', 'Georgia', 'Kentucky', 'Louisiana', 'Mississippi',
+              'North Carolina', 'South Carolina', 'Tennessee', 'Virginia'],
+    'West': ['Arizona', 'California', 'Colorado', 'Idaho', 'Montana', 'Nevada', 'New Mexico', 'Oregon', 'Utah',
+             'Washington', 'Wyoming'],
+}
+
+# Share of order lines per state observed in Sample_Superstore.csv
+STATE_SHARES = {
+    'California': 0.2002, 'New York': 0.1129, 'Texas': 0.0986, 'Pennsylvania': 0.0587, 'Washington': 0.0506,
+    'Illinois': 0.0492, 'Ohio': 0.0469, 'Florida': 0.0383, 'Michigan': 0.0255, 'North Carolina': 0.0249,
+    'Arizona': 0.0224, 'Virginia': 0.0224, 'Georgia': 0.0184, 'Tennessee': 0.0183, 'Colorado': 0.0182,
+    'Indiana': 0.0149, 'Kentucky': 0.0139, 'Massachusetts': 0.0135, 'New Jersey': 0.013, 'Oregon': 0.0124,
+    'Wisconsin': 0.011, 'Maryland': 0.0105, 'Delaware': 0.0096, 'Minnesota': 0.0089, 'Connecticut': 0.0082,
+    'Missouri': 0.0066, 'Oklahoma': 0.0066, 'Alabama': 0.0061, 'Arkansas': 0.006, 'Rhode Island': 0.0056,
+    'Utah': 0.0053, 'Mississippi': 0.0053, 'South Carolina': 0.0042, 'Louisiana': 0.0042, 'Nevada': 0.0039,
+    'Nebraska': 0.0038, 'New Mexico': 0.0037, 'Iowa': 0.003, 'New Hampshire': 0.0027, 'Kansas': 0.0024,
+    'Idaho': 0.0021, 'Montana': 0.0015, 'South Dakota': 0.0012, 'Vermont': 0.0011, 'District of Columbia': 0.001,
+    'Maine': 0.0008, 'North Dakota': 0.0007, 'West Virginia': 0.0004, 'Wyoming': 0.0001,
+}
+
+CATEGORY_SUBCATEGORIES = {
+    'Furniture': ['Bookcases', 'Chairs', 'Furnishings', 'Tables'],
+    'Office Supplies': ['Appliances', 'Art', 'Binders', 'Envelopes', 'Fasteners', 'Labels', 'Paper', 'Storage',
+                        'Supplies'],
+    'Technology': ['Accessories', 'Copiers', 'Machines', 'Phones'],
+}
+
+# Shares observed in Sample_Superstore.csv
+SHIP_MODES = {'Standard Class': 0.597, 'Second Class': 0.195, 'First Class': 0.154, 'Same Day': 0.054}
+SHIP_DAYS = {'Standard Class': (4, 7), 'Second Class': (2, 5), 'First Class': (1, 3), 'Same Day': (0, 0)}
+SEGMENTS = {'Consumer': 0.519, 'Corporate': 0.302, 'Home Office': 0.179}
+DISCOUNTS = {0.0: 0.48, 0.2: 0.366, 0.7: 0.042, 0.8: 0.03, 0.3: 0.023, 0.4: 0.021, 0.6: 0.014, 0.1: 0.009,
+             0.5: 0.007, 0.15: 0.005, 0.32: 0.003}
+
+FIRST_NAMES = ['Claire', 'Darrin', 'Sean', 'Brosina', 'Andrew', 'Irene', 'Harold', 'Pete', 'Alejandro', 'Zuschuss',
+               'Ken', 'Sandra', 'Emily', 'Eric', 'Tracy', 'Matt', 'Gene', 'Steve', 'Linda', 'Ruben']
+LAST_NAMES = ['Gute', 'Van Huff', "O'Donnell", 'Hoffman', 'Allen', 'Maddox', 'Pawlan', 'Kriz', 'Grove', 'Carroll',
+              'Black', 'Flanagan', 'Burnett', 'Hoffmann', 'Blumstein', 'Abelman', 'Hale', 'Nguyen', 'Weiss', 'Dunn']
+
+COLUMNS = ['Row ID', 'Order ID', 'Order Date', 'Ship Date', 'Ship Mode', 'Customer ID', 'Customer Name', 'Segment',
+           'Country', 'City', 'State', 'Postal Code', 'Region', 'Product ID', 'Category', 'Sub-Category',
+           'Product Name', 'Sales', 'Quantity', 'Discount', 'Profit']
+
+START_DATE = np.datetime64('2014-01-01')
+DAYS = 4 * 365
+# Bumped whenever a seed starts producing different rows, so data generated
+# and cached by an older version is not reused (2: observed state shares)
+GENERATOR_VERSION = 2
+
+
+def cardinalities(rows):
+    """Entity counts that grow with the row count the way the sample's do (about 2 lines per order)."""
+    return {
+        'orders': max(1, rows // 2),
+        'customers': max(800, rows // 12),
+        'products': min(max(1850, rows // 50), 200_000),
+        'cities': min(max(530, rows // 20), 20_000),
+    }
+
+
+def _choice(rng, weights, size):
+    keys = list(weights)
+    probabilities = np.array([weights[key] for key in keys])
+    return rng.choice(len(keys), size=size, p=probabilities / probabilities.sum())
+
+
+def _format_dates(dates):
+    parts = pd.DatetimeIndex(dates)
+    return (pd.Series(parts.month.astype(str)) + '/' + pd.Series(parts.day.astype(str)) + '/'
+            + pd.Series(parts.year.astype(str))).to_numpy()
+
+
+class SuperstoreGenerator:
+    """Seeded generator of Sample_Superstore.csv-shaped rows.
+
+    Customers, cities and products are fixed entity tables drawn once;
+    rows are produced in blocks of whole orders so every line of an order
+    shares its customer, dates and ship mode however the blocks are cut.
+    """
+
+    def __init__(self, rows, seed=0):
+        self.rows = rows
+        self.seed = seed
+        self.sizes = cardinalities(rows)
+        rng = np.random.default_rng(seed)
+
+        states = [(region, state) for region, names in REGION_STATES.items() for state in names]
+        self.state_names = np.array([state for _, state in states])
+        self.state_regions = np.array([region for region, _ in states])
+        # Every state gets a city, the rest are spread by the sample's state shares
+        state_shares = np.array([STATE_SHARES[state] for state in self.state_names])
+        state_shares /= state_shares.sum()
+        self.city_state = np.concatenate([np.arange(len(states)),
+                                          rng.choice(len(states), size=self.sizes['cities'] - len(states), p=state_shares)])
+        self.city_names = np.array([f'City {i:05d}' for i in range(self.sizes['cities'])])
+        self.city_postal = rng.integers(1000, 99999, size=self.sizes['cities'])
+
+        customers = self.sizes['customers']
+        first = rng.integers(len(FIRST_NAMES), size=customers)
+        last = rng.integers(len(LAST_NAMES), size=customers)
+        self.customer_names = np.array([f'{FIRST_NAMES[f]} {LAST_NAMES[l]}' for f, l in zip(first, last)])
+        self.customer_ids = np.array([f'{FIRST_NAMES[f][0]}{LAST_NAMES[l][0]}-{10000 + i}'
+                                      for i, (f, l) in enumerate(zip(first, last))])
+        self.customer_segment = _choice(rng, SEGMENTS, customers)
+        # Customers pick cities so that each state's share of them, and so of
+        # the order lines, follows the sample; the first lives in the first
+        # state's own city and so on, so even small datasets cover every state
+        cities_per_state = np.bincount(self.city_state, minlength=len(states))
+        city_weights = state_shares[self.city_state] / cities_per_state[self.city_state]
+        self.customer_city = np.concatenate([np.arange(len(states)),
+                                             rng.choice(self.sizes['cities'], size=customers - len(states), p=city_weights)])
+
+        subcategories = [(category, sub) for category, subs in CATEGORY_SUBCATEGORIES.items() for sub in subs]
+        self.subcategory_names = np.array([sub for _, sub in subcategories])
+        self.subcategory_categories = np.array([category for category, _ in subcategories])
+        products = self.sizes['products']
+        self.product_subcategory = rng.integers(len(subcategories), size=products)
+        self.product_names = np.array([f'{self.subcategory_names[s]} Item {i:06d}'
+                                       for i, s in enumerate(self.product_subcategory)])
+        self.product_ids = np.array([f'{self.subcategory_categories[s][:3].upper()}-{self.subcategory_names[s][:2].upper()}-{10000000 + i}'
+                                     for i, s in enumerate(self.product_subcategory)])
+        self.product_price = rng.lognormal(mean=3.0, sigma=1.3, size=products)
+        self.product_margin = rng.normal(0.15, 0.12, size=products)
+        # Zipf-like popularity so a few products dominate, as in the sample
+        popularity = 1.0 / np.arange(1, products + 1) ** 0.6
+        self.product_popularity = rng.permutation(popularity / popularity.sum())
+
+    def _first_row(self, order):
+        return -(-order * self.rows // self.sizes['orders'])
+
+    def blocks(self, block_rows=1_000_000):
+        """Yield DataFrames of about `block_rows` rows each, covering all rows in Row ID order."""
+        orders = self.sizes['orders']
+        block_orders = max(1, block_rows * orders // self.rows)
+        for first_order in range(0, orders, block_orders):
+            last_order = min(orders, first_order + block_orders)
+            yield self._block(first_order, last_order)
+
+    def _block(self, first_order, last_order):
+        rng = np.random.default_rng([self.seed, first_order])
+        order_count = last_order - first_order
+        start, stop = self._first_row(first_order), self._first_row(last_order)
+        order_of_row = (np.arange(start, stop) * self.sizes['orders']) // self.rows - first_order
+
+        # Order-level attributes, broadcast to the order's lines
+        customer = rng.integers(self.sizes['customers'], size=order_count)
+        order_day = (np.arange(first_order, last_order) * DAYS // self.sizes['orders']
+                     + rng.integers(-3, 4, size=order_count)).clip(0, DAYS - 1)
+        ship_mode = _choice(rng, SHIP_MODES, order_count)
+        low = np.array([SHIP_DAYS[mode][0] for mode in SHIP_MODES])[ship_mode]
+        high = np.array([SHIP_DAYS[mode][1] for mode in SHIP_MODES])[ship_mode]
+        ship_day = order_day + rng.integers(low, high + 1)
+        order_dates = START_DATE + order_day
+        years = pd.DatetimeIndex(order_dates).year.astype(str).to_numpy()
+        order_ids = np.char.add(np.char.add('CA-', years.astype('U4')),
+                                np.char.add('-', (100000 + np.arange(first_order, last_order)).astype('U7')))
+
+        customer = customer[order_of_row]
+        city = self.customer_city[customer]
+        state = self.city_state[city]
+        rows = stop - start
+        product = rng.choice(self.sizes['products'], size=rows, p=self.product_popularity)
+        subcategory = self.product_subcategory[product]
+        quantity = rng.geometric(0.27, size=rows).clip(max=14)
+        discount = np.array(list(DISCOUNTS))[_choice(rng, DISCOUNTS, rows)]
+        sales = (self.product_price[product] * quantity * (1 - discount)).round(4)
+        profit = (sales * (self.product_margin[product] - discount * 0.8)).round(4)
+
+        return pd.DataFrame({
+            'Row ID': np.arange(start, stop) + 1,
+            'Order ID': order_ids[order_of_row],
+            'Order Date': _format_dates(order_dates)[order_of_row],
+            'Ship Date': _format_dates(START_DATE + ship_day)[order_of_row],
+            'Ship Mode': np.array(list(SHIP_MODES))[ship_mode][order_of_row],
+            'Customer ID': self.customer_ids[customer],
+            'Customer Name': self.customer_names[customer],
+            'Segment': np.array(list(SEGMENTS))[self.customer_segment[customer]],
+            'Country': 'United States',
+            'City': self.city_names[city],
+            'State': self.state_names[state],
+            'Postal Code': self.city_postal[city],
+            'Region': self.state_regions[state],
+            'Product ID': self.product_ids[product],
+            'Category': self.subcategory_categories[subcategory],
+            'Sub-Category': self.subcategory_names[subcategory],
+            'Product Name': self.product_names[product],
+            'Sales': sales,
+            'Quantity': quantity,
+            'Discount': discount,
+            'Profit': profit,
+        }, columns=COLUMNS)
+
+    def write_csv(self, path, block_rows=1_000_000):
+        """Write the whole dataset to `path` in the superstore's Latin-1 CSV layout."""
+        for index, block in enumerate(self.blocks(block_rows)):
+            block.to_csv(path, mode='w' if index == 0 else 'a', header=index == 0, index=False, encoding=ENCODING)
+        return path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a synthetic Sample_Superstore.csv-shaped dataset')
+    parser.add_argument('rows', type=int, help='number of order lines to generate')
+    parser.add_argument('output', help='CSV file to write')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    SuperstoreGenerator(args.rows, seed=args.seed).write_csv(args.output)
+    print(f"✓ Saved: {args.output}")
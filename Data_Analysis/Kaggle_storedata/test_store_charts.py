@@ -0,0 +1,25 @@
+import pandas as pd
+
+from store_charts import render_charts, sales_comparison_bar
+
+
+def test_second_in_process_render_is_up_to_date(tmp_path):
+    region_sales = pd.DataFrame({'Sales': [3.0, 2.0, 1.0]}, index=pd.Index(['West', 'East', 'South'], name='Region'))
+    cache_path = str(tmp_path / 'charts.json')
+    charts = [(sales_comparison_bar, region_sales, str(tmp_path / 'bar.png'))]
+
+    first = render_charts(charts, cache_path=cache_path, workers=1)
+    second = render_charts(charts, cache_path=cache_path, workers=1)
+
+    assert first == [f"✓ Saved: {tmp_path / 'bar.png'}"]
+    assert second == [f"✓ Up to date: {tmp_path / 'bar.png'}"]
+
+
+def test_changed_input_is_drawn_again(tmp_path):
+    region_sales = pd.DataFrame({'Sales': [3.0, 2.0]}, index=pd.Index(['West', 'East'], name='Region'))
+    cache_path = str(tmp_path / 'charts.json')
+    path = str(tmp_path / 'bar.png')
+    render_charts([(sales_comparison_bar, region_sales, path)], cache_path=cache_path, workers=1)
+
+    changed = region_sales.assign(Sales=[3.0, 4.0])
+    assert render_charts([(sales_comparison_bar, changed, path)], cache_path=cache_path, workers=1) == [f"✓ Saved: {path}"]
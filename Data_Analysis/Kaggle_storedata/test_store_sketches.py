@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+
+from store_sketches import CountMinTopK
+
+
+def test_integer_key_estimates_stay_within_error_bound():
+    rng = np.random.default_rng(0)
+    keys = rng.zipf(1.3, 200_000)
+    keys = keys[keys <= 5_000]
+    weights = rng.uniform(1, 100, len(keys))
+    sketch = CountMinTopK()
+    for start in range(0, len(keys), 20_000):
+        sketch.add(keys[start:start + 20_000], weights[start:start + 20_000])
+
+    exact = pd.Series(weights).groupby(keys).sum()
+    over_count = sketch.estimate(exact.index).to_numpy() - exact.to_numpy()
+    # Count-Min never under-counts, up to float rounding
+    assert over_count.min() > -1e-6
+    assert over_count.max() <= sketch.error_bound
+    assert list(sketch.top(5).index) == list(exact.nlargest(5).index)
@@ -0,0 +1,183 @@
+import html
+import json
+import os
+import sys
+
+# Output format ('text', 'json', 'html', 'markdown') and file; stdout when no file is given
+REPORT_FORMAT_ENV = 'ANALYSIS_REPORT_FORMAT'
+REPORT_PATH_ENV = 'ANALYSIS_REPORT_PATH'
+
+
+class Report:
+    """Analysis output collected as structured sections and written in one pass.
+
+    A section holds values (a key, the raw value and its console line),
+    tables (a DataFrame or Series and its console text) and free-text
+    notes.  The text emitter replays the console lines exactly as the
+    scripts used to print them; the other emitters work from the raw values
+    and frames, so dashboards can read the numbers instead of scraping text.
+    """
+
+    def __init__(self, title, fmt='text', path=None):
+        self.title = title
+        self.fmt = fmt
+        self.path = path
+        self.sections = []
+
+    @classmethod
+    def from_env(cls, title):
+        return cls(title, fmt=os.environ.get(REPORT_FORMAT_ENV, 'text'), path=os.environ.get(REPORT_PATH_ENV))
+
+    def section(self, title, banner=None):
+        """Start a section; `banner` is its console heading (default `=== title ===`)."""
+        self.sections.append({
+            'title': title,
+            'banner': f"=== {title} ===" if banner is None else banner,
+            'blocks': [],
+        })
+        return self
+
+    def extend(self, sections):
+        """Append sections built elsewhere, e.g. by a worker process."""
+        self.sections.extend(sections)
+        return self
+
+    def _add(self, block):
+        if not self.sections:
+            self.section(self.title)
+        self.sections[-1]['blocks'].append(block)
+        return self
+
+    def text(self, line=''):
+        """A console line with no structured meaning (notes, spacing)."""
+        return self._add({'kind': 'text', 'text': line})
+
+    def value(self, key, value, text):
+        return self._add({'kind': 'value', 'key': key, 'value': value, 'text': text})
+
+    def table(self, key, frame, text=None):
+        """A DataFrame/Series result; `text` overrides its console rendering."""
+        return self._add({'kind': 'table', 'key': key, 'frame': frame, 'text': str(frame) if text is None else text})
+
+    def subset(self, start, end=None):
+        """A report holding only sections[start:end], e.g. to render one stage on its own."""
+        part = Report(self.title, self.fmt, self.path)
+        part.sections = self.sections[start:end]
+        return part
+
+    def render(self, fmt=None):
+        return EMITTERS[fmt or self.fmt](self)
+
+    def finish(self):
+        """Render the whole report and write it with a single call."""
+        output = self.render()
+        if self.path is None:
+            sys.stdout.write(output)
+            sys.stdout.flush()
+        else:
+            with open(self.path, 'w', encoding='utf-8') as file:
+                file.write(output)
+            print(f"✓ Saved: {self.path}")
+
+
+def _records(frame):
+    # pandas is only needed once there are frames to emit, so it is imported here
+    import pandas as pd
+
+    if isinstance(frame, pd.Series):
+        frame = frame.to_frame()
+    if not isinstance(frame.index, pd.RangeIndex):
+        frame = frame.reset_index()
+    return frame.rename(columns=str)
+
+
+def _display(value):
+    if isinstance(value, (list, tuple)):
+        return ', '.join(map(str, value))
+    return str(value)
+
+
+def _plain(value):
+    # json.dumps fallback for numpy scalars, timestamps and the like
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return _records(value).to_dict('records')
+    return str(value)
+
+
+def text_emitter(report):
+    lines = []
+    for section in report.sections:
+        if section['banner'] != '':
+            lines.append(section['banner'])
+        # A table with nothing to list prints no line at all
+        lines.extend(block['text'] for block in section['blocks'] if block['kind'] == 'text' or block['text'])
+    return '\n'.join(lines) + '\n'
+
+
+def json_emitter(report):
+    sections = []
+    for section in report.sections:
+        entry = {'title': section['title'], 'values': {}, 'tables': {}, 'notes': []}
+        for block in section['blocks']:
+            if block['kind'] == 'value':
+                entry['values'][block['key']] = block['value']
+            elif block['kind'] == 'table':
+                entry['tables'][block['key']] = _records(block['frame']).to_dict('records')
+            elif block['text'].strip():
+                entry['notes'].append(block['text'].strip())
+        sections.append(entry)
+    return json.dumps({'title': report.title, 'sections': sections}, indent=2, default=_plain) + '\n'
+
+
+def _markdown_table(frame):
+    frame = _records(frame)
+    lines = ['| ' + ' | '.join(frame.columns) + ' |', '|' + ' --- |' * len(frame.columns)]
+    lines.extend('| ' + ' | '.join(map(str, row)) + ' |' for row in frame.itertuples(index=False))
+    return '\n'.join(lines)
+
+
+def markdown_emitter(report):
+    parts = [f"# {report.title}"]
+    for section in report.sections:
+        parts.append(f"## {section['title']}")
+        for block in section['blocks']:
+            if block['kind'] == 'value':
+                parts.append(f"- **{block['key']}**: {_display(block['value'])}")
+            elif block['kind'] == 'table':
+                parts.append(f"**{block['key']}**\n\n{_markdown_table(block['frame'])}")
+            elif block['text'].strip():
+                parts.append(block['text'].strip())
+    return '\n\n'.join(parts) + '\n'
+
+
+def html_emitter(report):
+    title = html.escape(report.title)
+    parts = [f"<!DOCTYPE html>\n<html>\n<head><meta charset=\"utf-8\"><title>{title}</title></head>\n<body>",
+             f"<h1>{title}</h1>"]
+    for section in report.sections:
+        parts.append(f"<h2>{html.escape(section['title'])}</h2>")
+        values = [block for block in section['blocks'] if block['kind'] == 'value']
+        if values:
+            parts.append('<dl>' + ''.join(f"<dt>{html.escape(block['key'])}</dt><dd>{html.escape(_display(block['value']))}</dd>"
+                                          for block in values) + '</dl>')
+        for block in section['blocks']:
+            if block['kind'] == 'table':
+                parts.append(f"<h3>{html.escape(block['key'])}</h3>\n{_records(block['frame']).to_html(index=False)}")
+            elif block['kind'] == 'text' and block['text'].strip():
+                parts.append(f"<p>{html.escape(block['text'].strip())}</p>")
+    parts.append('</body>\n</html>')
+    return '\n'.join(parts) + '\n'
+
+
+# Formats by name; register another emitter by adding a function taking the Report
+EMITTERS = {
+    'text': text_emitter,
+    'json': json_emitter,
+    'markdown': markdown_emitter,
+    'html': html_emitter,
+}
@@ -0,0 +1,86 @@
+import json
+import os
+import time
+
+# Set to a file path to print a per-stage summary and write a Chrome trace there
+TRACE_ENV = 'ANALYSIS_TRACE'
+
+
+class StageTracer:
+    """Wall-clock timings of the named sections of an analysis script.
+
+    Stages follow the scripts' banners: `begin` closes the running stage
+    and opens the next one, so sections need no re-indenting.  Each stage
+    records the row count and in-memory size of the frame it works on.
+    `write_trace` emits Chrome trace-event JSON (chrome://tracing, Perfetto).
+    """
+
+    def __init__(self, script, trace_path=None, deep_memory=True):
+        self.script = script
+        self.trace_path = trace_path
+        self.deep_memory = deep_memory
+        self.stages = []
+        self._current = None
+        self._origin = time.perf_counter_ns()
+
+    @classmethod
+    def from_env(cls, script):
+        return cls(script, trace_path=os.environ.get(TRACE_ENV))
+
+    @property
+    def enabled(self):
+        return self.trace_path is not None
+
+    def _measure(self, frame):
+        if frame is None:
+            return {}
+        return {'rows': len(frame), 'memory_bytes': int(frame.memory_usage(deep=self.deep_memory).sum())}
+
+    def begin(self, name, frame=None):
+        """Close the running stage (if any) and start `name`, sized by `frame`."""
+        self.end()
+        self._current = {'name': name, 'start_ns': time.perf_counter_ns(), **self._measure(frame)}
+
+    def observe(self, frame):
+        """Re-size the running stage from `frame`, e.g. once it has been loaded."""
+        if self._current is not None:
+            self._current.update(self._measure(frame))
+
+    def end(self):
+        if self._current is not None:
+            self._current['end_ns'] = time.perf_counter_ns()
+            self.stages.append(self._current)
+            self._current = None
+
+    def summary(self):
+        """Plain-text table of stage durations, rows and memory."""
+        lines = [f"{'Stage':<45} {'Seconds':>9} {'Rows':>12} {'Memory (MB)':>12}"]
+        for stage in self.stages:
+            seconds = (stage['end_ns'] - stage['start_ns']) / 1e9
+            rows = f"{stage['rows']:,}" if 'rows' in stage else '-'
+            memory = f"{stage['memory_bytes'] / 2**20:,.2f}" if 'memory_bytes' in stage else '-'
+            lines.append(f"{stage['name'][:45]:<45} {seconds:>9.3f} {rows:>12} {memory:>12}")
+        return '\n'.join(lines)
+
+    def write_trace(self, path):
+        events = [{
+            'name': stage['name'],
+            'cat': self.script,
+            'ph': 'X',
+            'ts': (stage['start_ns'] - self._origin) / 1000,
+            'dur': (stage['end_ns'] - stage['start_ns']) / 1000,
+            'pid': os.getpid(),
+            'tid': 0,
+            'args': {key: stage[key] for key in ('rows', 'memory_bytes') if key in stage},
+        } for stage in self.stages]
+        with open(path, 'w') as file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file, indent=1)
+
+    def finish(self):
+        """End the last stage and, when tracing is enabled, report and write the trace."""
+        self.end()
+        if self.enabled:
+            print(f"\n=== STAGE TIMINGS ({self.script}) ===")
+            print(self.summary())
+            self.write_trace(self.trace_path)
+            print(f"✓ Saved: {self.trace_path}")
@@ -0,0 +1,178 @@
+import argparse
+
+import numpy as np
+import pandas as pd
+
+# Distinct values are counted exactly up to this many per column, then reported as a lower bound
+DISTINCT_LIMIT = 100_000
+# Row hashes of chunks are buffered and merged into the seen set once they reach this many
+ROW_BATCH = 1_000_000
+
+
+def _combine_dtypes(dtypes):
+    # Chunks may parse a column differently; numeric ones promote, anything else is object
+    if len(dtypes) == 1:
+        return next(iter(dtypes))
+    if all(pd.api.types.is_numeric_dtype(dtype) for dtype in dtypes):
+        return str(np.result_type(*dtypes))
+    return 'object'
+
+
+def _combine_kinds(kinds):
+    # Integers that met a NaN in some chunk are floats overall
+    if kinds == {'integer', 'floating'}:
+        return 'floating'
+    return kinds.pop() if len(kinds) == 1 else 'mixed'
+
+
+class DataProfile:
+    """Per-column data-quality statistics gathered in a single pass over chunks.
+
+    Every chunk is visited once for null counts, pandas and inferred
+    types, min/max and distinct values, plus one vectorized row hash for
+    duplicate rows across all chunks.  Distinct values are tracked as
+    64-bit hashes, up to `distinct_limit` per column; an ID column past
+    that reports `>= limit` instead of holding every value.  Row hashes
+    take 8 bytes per distinct row; each chunk's are buffered and merged into
+    the sorted set of seen rows in batches at least as large as that set,
+    so a row is re-merged O(log chunks) times rather than once per chunk.
+    """
+
+    def __init__(self, distinct_limit=DISTINCT_LIMIT):
+        self.distinct_limit = distinct_limit
+        self.rows = 0
+        self.columns = {}
+        self._seen_rows = np.empty(0, dtype=np.uint64)
+        self._row_parts = []
+        self._buffered_rows = 0
+
+    def _column(self, name):
+        if name not in self.columns:
+            self.columns[name] = {'dtypes': set(), 'kinds': set(), 'nulls': 0, 'min': None, 'max': None,
+                                  'distinct': np.empty(0, dtype=np.uint64), 'capped': False}
+        return self.columns[name]
+
+    @staticmethod
+    def _extreme(current, value, pick):
+        if value is None or pd.isna(value):
+            return current
+        if current is None:
+            return value
+        try:
+            return pick(current, value)
+        except TypeError:
+            # Values of different types in one column have no order
+            return current
+
+    def add(self, chunk):
+        self.rows += len(chunk)
+        missing = chunk.isna()
+        nulls = missing.sum()
+        # Each column is hashed once; the hashes give its distinct values and,
+        # combined across columns, a hash per row for duplicate rows
+        row_hashes = np.zeros(len(chunk), dtype=np.uint64)
+        for name, values in chunk.items():
+            column = self._column(name)
+            column['nulls'] += int(nulls[name])
+            column['dtypes'].add(str(values.dtype))
+            hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+            row_hashes = row_hashes * np.uint64(1_000_003) ^ hashes
+            if nulls[name] == len(values):
+                continue
+            column['kinds'].add(pd.api.types.infer_dtype(values, skipna=True))
+            if not isinstance(values.dtype, pd.CategoricalDtype) or values.cat.ordered:
+                try:
+                    low, high = values.min(), values.max()
+                except TypeError:
+                    low = high = None
+                column['min'] = self._extreme(column['min'], low, min)
+                column['max'] = self._extreme(column['max'], high, max)
+            if not column['capped']:
+                self._add_distinct(column, np.unique(hashes[~missing[name].to_numpy()]))
+
+        self._buffer_rows(np.unique(row_hashes))
+        return self
+
+    def _buffer_rows(self, hashes):
+        self._row_parts.append(hashes)
+        self._buffered_rows += len(hashes)
+        if self._buffered_rows >= max(ROW_BATCH, len(self._seen_rows)):
+            self._merge_rows()
+
+    def _merge_rows(self):
+        if self._row_parts:
+            self._seen_rows = np.unique(np.concatenate([self._seen_rows] + self._row_parts))
+            self._row_parts, self._buffered_rows = [], 0
+        return self._seen_rows
+
+    @property
+    def duplicates(self):
+        """Rows whose values all repeat an earlier row, in any chunk."""
+        return self.rows - len(self._merge_rows())
+
+    def _add_distinct(self, column, hashes):
+        column['distinct'] = np.union1d(column['distinct'], hashes)
+        if len(column['distinct']) > self.distinct_limit:
+            column['distinct'], column['capped'] = np.empty(0, dtype=np.uint64), True
+
+    def merge(self, other):
+        """Fold in a profile of other rows, e.g. built by a worker process."""
+        self.rows += other.rows
+        for hashes in [other._seen_rows] + other._row_parts:
+            self._buffer_rows(hashes)
+        for name, theirs in other.columns.items():
+            column = self._column(name)
+            column['nulls'] += theirs['nulls']
+            column['dtypes'] |= theirs['dtypes']
+            column['kinds'] |= theirs['kinds']
+            column['min'] = self._extreme(column['min'], theirs['min'], min)
+            column['max'] = self._extreme(column['max'], theirs['max'], max)
+            if theirs['capped']:
+                column['distinct'], column['capped'] = np.empty(0, dtype=np.uint64), True
+            elif not column['capped']:
+                self._add_distinct(column, theirs['distinct'])
+        return self
+
+    def table(self):
+        """One row per column: pandas dtype, inferred type, nulls, min, max and distinct count."""
+        records = {}
+        for name, column in self.columns.items():
+            records[name] = {
+                'dtype': _combine_dtypes(column['dtypes']),
+                'inferred': _combine_kinds(set(column['kinds'])) if column['kinds'] else 'empty',
+                'nulls': column['nulls'],
+                'min': column['min'],
+                'max': column['max'],
+                'distinct': f">={self.distinct_limit:,}" if column['capped'] else len(column['distinct']),
+            }
+        return pd.DataFrame.from_dict(records, orient='index').rename_axis('column')
+
+
+def profile_frame(frame):
+    return DataProfile().add(frame)
+
+
+def profile_chunks(chunks, distinct_limit=DISTINCT_LIMIT):
+    profile = DataProfile(distinct_limit)
+    for chunk in chunks:
+        profile.add(chunk)
+    return profile
+
+
+def profile_csv(path, chunksize=1_000_000, **read_kwargs):
+    """Profile a CSV of any size, `chunksize` rows at a time."""
+    return profile_chunks(pd.read_csv(path, chunksize=chunksize, **read_kwargs))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Single-pass data-quality profile of CSV files')
+    parser.add_argument('paths', nargs='+', help='CSV files, profiled together as one dataset')
+    parser.add_argument('--chunksize', type=int, default=1_000_000)
+    parser.add_argument('--encoding', default='utf-8')
+    args = parser.parse_args()
+
+    profile = profile_chunks(chunk for path in args.paths
+                             for chunk in pd.read_csv(path, chunksize=args.chunksize, encoding=args.encoding))
+    print(f"=== DATA QUALITY PROFILE ({', '.join(args.paths)}) ===")
+    print(f"Rows: {profile.rows:,}   Duplicate rows: {profile.duplicates:,}")
+    print(profile.table().to_string())
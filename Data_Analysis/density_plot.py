@@ -0,0 +1,70 @@
+import os
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.colors import LogNorm
+
+# 'scatter', 'binned' or 'auto' (bin only above DENSITY_THRESHOLD points)
+PLOT_MODE_ENV = 'ANALYSIS_PLOT_MODE'
+DENSITY_THRESHOLD = 50_000
+
+
+def _edges(values, bins):
+    """Bin edges over the data range; an integer-valued column gets one bin per value."""
+    low, high = np.nanmin(values), np.nanmax(values)
+    if high - low < bins and np.array_equal(values, np.round(values), equal_nan=True):
+        return np.arange(low - 0.5, high + 1.5)
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    return np.linspace(low, high, bins + 1)
+
+
+def _bin_index(values, edges):
+    # Edges are evenly spaced, so the bin follows from arithmetic instead of a search
+    index = ((values - edges[0]) * ((len(edges) - 1) / (edges[-1] - edges[0]))).astype(np.intp)
+    return np.clip(index, 0, len(edges) - 2)
+
+
+def bin_points(x, y, c=None, bins=100):
+    """Point counts (and the mean of `c`) on a 2D grid, as (counts, means, x_edges, y_edges).
+
+    Every point's cell is computed arithmetically and tallied with
+    `np.bincount`, one vectorized pass whatever the row count; cells
+    without points are NaN in `means`.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    present = ~(np.isnan(x) | np.isnan(y))
+    if not present.all():
+        x, y = x[present], y[present]
+        c = None if c is None else np.asarray(c, dtype=float)[present]
+    x_edges, y_edges = _edges(x, bins), _edges(y, bins)
+    shape = (len(x_edges) - 1, len(y_edges) - 1)
+    cells = _bin_index(x, x_edges) * shape[1] + _bin_index(y, y_edges)
+    counts = np.bincount(cells, minlength=shape[0] * shape[1]).reshape(shape)
+    means = None
+    if c is not None:
+        sums = np.bincount(cells, weights=np.asarray(c, dtype=float), minlength=counts.size).reshape(shape)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+    return counts, means, x_edges, y_edges
+
+
+def density_scatter(x, y, c=None, bins=100, mode=None, ax=None, **scatter_kwargs):
+    """`plt.scatter` for small inputs, a 2D-binned raster for large ones.
+
+    In binned mode each cell is coloured by the mean of `c` over its
+    points, or by the point count (log scale) when there is no `c`, so the
+    drawing cost depends on the grid size rather than on the row count.
+    Returns the mappable either way, ready for `plt.colorbar`.
+    """
+    ax = ax or plt.gca()
+    mode = mode or os.environ.get(PLOT_MODE_ENV, 'auto')
+    if mode == 'scatter' or (mode == 'auto' and len(x) <= DENSITY_THRESHOLD):
+        return ax.scatter(x, y, c=c, **scatter_kwargs)
+
+    counts, means, x_edges, y_edges = bin_points(x, y, c, bins)
+    cmap = scatter_kwargs.get('cmap', 'viridis')
+    if means is None:
+        return ax.pcolormesh(x_edges, y_edges, np.ma.masked_equal(counts, 0).T, cmap=cmap, norm=LogNorm())
+    return ax.pcolormesh(x_edges, y_edges, np.ma.masked_invalid(means).T, cmap=cmap)
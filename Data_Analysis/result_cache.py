@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import pickle
+import time
+
+# Where cached results live, how large the cache may grow, and whether to print hit/miss stats
+CACHE_DIR_ENV = 'ANALYSIS_CACHE_DIR'
+CACHE_MB_ENV = 'ANALYSIS_CACHE_MB'
+CACHE_STATS_ENV = 'ANALYSIS_CACHE_STATS'
+INDEX_FILE = 'index.json'
+
+
+def dataset_fingerprint(*paths):
+    """Digest of the inputs' paths, sizes and mtimes; rewriting any input changes it."""
+    parts = []
+    for path in paths:
+        stat = os.stat(path)
+        parts.append([os.path.abspath(path), stat.st_size, stat.st_mtime_ns])
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+class ResultCache:
+    """On-disk memo of aggregation results shared across runs.
+
+    An entry is keyed by the dataset fingerprint, the group keys, the
+    aggregated metrics (with their functions) and any row filters, and is
+    pickled to its own file.  `index.json` records each entry's size and
+    last use; once the total passes `max_bytes` the least recently used
+    entries are deleted.  A `max_bytes` of 0 disables storing.
+    """
+
+    def __init__(self, script, directory='.analysis_cache', max_bytes=256 * 2**20, verbose=False):
+        self.script = script
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.verbose = verbose
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._index = self._read_index()
+
+    @classmethod
+    def from_env(cls, script):
+        return cls(script,
+                   directory=os.environ.get(CACHE_DIR_ENV, '.analysis_cache'),
+                   max_bytes=int(float(os.environ.get(CACHE_MB_ENV, 256)) * 2**20),
+                   verbose=bool(os.environ.get(CACHE_STATS_ENV)))
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _read_index(self):
+        try:
+            with open(self._path(INDEX_FILE)) as file:
+                index = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        # Drop entries whose files were removed behind the cache's back
+        return {key: entry for key, entry in index.items() if os.path.exists(self._path(key + '.pkl'))}
+
+    def _write_index(self):
+        os.makedirs(self.directory, exist_ok=True)
+        temporary = self._path(INDEX_FILE + '.tmp')
+        with open(temporary, 'w') as file:
+            json.dump(self._index, file)
+        os.replace(temporary, self._path(INDEX_FILE))
+
+    @staticmethod
+    def key(fingerprint, keys, metrics, filters=None):
+        """Entry name for one aggregation of one version of the data."""
+        spec = [fingerprint, list(keys), metrics, filters or {}]
+        return hashlib.sha256(json.dumps(spec, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get(self, key):
+        """(True, result) on a hit, (False, None) on a miss."""
+        if key in self._index:
+            try:
+                with open(self._path(key + '.pkl'), 'rb') as file:
+                    result = pickle.load(file)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                del self._index[key]
+            else:
+                self.hits += 1
+                self._index[key]['used'] = time.time_ns()
+                self._write_index()
+                return True, result
+        self.misses += 1
+        return False, None
+
+    def put(self, key, result):
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_bytes:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        temporary = self._path(key + '.pkl.tmp')
+        with open(temporary, 'wb') as file:
+            file.write(data)
+        os.replace(temporary, self._path(key + '.pkl'))
+        self._index[key] = {'size': len(data), 'used': time.time_ns()}
+        self._evict()
+        self._write_index()
+
+    def _evict(self):
+        total = sum(entry['size'] for entry in self._index.values())
+        for key in sorted(self._index, key=lambda name: self._index[name]['used']):
+            if total <= self.max_bytes:
+                break
+            total -= self._index.pop(key)['size']
+            self.evictions += 1
+            try:
+                os.remove(self._path(key + '.pkl'))
+            except OSError:
+                pass
+
+    def memoize(self, fingerprint, keys, metrics, compute, filters=None):
+        """Cached result of `compute()` for this aggregation, computing and storing it on a miss."""
+        key = self.key(fingerprint, keys, metrics, filters)
+        found, result = self.get(key)
+        if not found:
+            result = compute()
+            self.put(key, result)
+        return result
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._index),
+            'bytes': sum(entry['size'] for entry in self._index.values()),
+            'max_bytes': self.max_bytes,
+        }
+
+    def finish(self):
+        """Print this run's hit/miss counts when stats were requested."""
+        if self.verbose:
+            stats = self.stats()
+            print(f"\n=== RESULT CACHE ({self.script}) ===")
+            print(f"Hits: {stats['hits']}, misses: {stats['misses']}, evictions: {stats['evictions']}")
+            print(f"Stored: {stats['entries']} entries, {stats['bytes'] / 2**20:,.2f} MB "
+                  f"of {stats['max_bytes'] / 2**20:,.2f} MB")